@@ -0,0 +1,161 @@
+"""
+KarianaUMCP Editor Caches
+=========================
+Editor singletons and the level actor label index shared by the ops modules.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
+import threading
+import time
+
+
+# =============================================================================
+# Editor Singletons
+# =============================================================================
+
+# Resolved on first use; they live for the whole editor session
+_AR = None
+_ASSET_TOOLS = None
+_ACTOR_SUBSYSTEM = None
+
+
+def asset_registry():
+    """AssetRegistry handle, looked up once"""
+    global _AR
+    if _AR is None:
+        import unreal
+        _AR = unreal.AssetRegistryHelpers.get_asset_registry()
+    return _AR
+
+
+def asset_tools():
+    """AssetTools instance, looked up once"""
+    global _ASSET_TOOLS
+    if _ASSET_TOOLS is None:
+        import unreal
+        _ASSET_TOOLS = unreal.AssetToolsHelpers.get_asset_tools()
+    return _ASSET_TOOLS
+
+
+def actor_subsystem():
+    """EditorActorSubsystem, looked up once"""
+    global _ACTOR_SUBSYSTEM
+    if _ACTOR_SUBSYSTEM is None:
+        import unreal
+        _ACTOR_SUBSYSTEM = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    return _ACTOR_SUBSYSTEM
+
+
+def asset_class_name(asset_data, _getattr=getattr) -> str:
+    """Short class name of an AssetData entry"""
+    class_path = _getattr(asset_data, 'asset_class_path', None)
+    if class_path is None:
+        # UE 5.0 AssetData only carries the short class name
+        return str(_getattr(asset_data, 'asset_class', "Unknown"))
+    name = _getattr(class_path, 'asset_name', None)
+    return str(name if name is not None else class_path)
+
+
+@lru_cache(maxsize=256)
+def _class_path(class_name: str) -> str:
+    """Full path (/Script/Module.Class) of a class exposed to Python by its short name"""
+    import unreal
+    cls = getattr(unreal, class_name, None)
+    try:
+        return cls.static_class().get_path_name()
+    except Exception:
+        return f"/Script/Engine.{class_name}"
+
+
+@lru_cache(maxsize=256)
+def class_filter(*class_names: str) -> Dict[str, Any]:
+    """ARFilter class arguments selecting the given classes, chosen once per engine version"""
+    import unreal
+
+    # UE 5.1+ identifies classes by TopLevelAssetPath; 5.0 by short class name
+    if hasattr(unreal, "TopLevelAssetPath"):
+        paths = [_class_path(name).rsplit(".", 1) for name in class_names]
+        return {"class_paths": [unreal.TopLevelAssetPath(package, name) for package, name in paths]}
+    return {"class_names": list(class_names)}
+
+
+# =============================================================================
+# Asset Listing Invalidation
+# =============================================================================
+
+# Bumped by any command that creates, moves or deletes assets; cached asset
+# listings remember the generation they were built in and are dropped once
+# it changes
+_ASSET_LISTINGS_GENERATION = 0
+
+
+def invalidate_asset_listings():
+    """Mark every cached asset listing as stale"""
+    global _ASSET_LISTINGS_GENERATION
+    _ASSET_LISTINGS_GENERATION += 1
+
+
+def asset_listings_generation() -> int:
+    """Current asset listing generation"""
+    return _ASSET_LISTINGS_GENERATION
+
+
+# =============================================================================
+# Actor Label Index
+# =============================================================================
+
+# Level actors by Outliner label. Entries are re-checked on use, so the TTL
+# only bounds how long newly spawned or relabelled actors go unseen.
+ACTOR_LABEL_TTL = 2.0
+_ACTOR_LABELS: Dict[str, Any] = {}
+_ACTOR_LABELS_EXPIRES = 0.0
+_ACTOR_LABELS_LOCK = threading.Lock()
+
+
+def _cached_actor(label: str):
+    """Actor from the label index if it is still current, alive and labelled `label`"""
+    with _ACTOR_LABELS_LOCK:
+        actor = _ACTOR_LABELS.get(label) if _ACTOR_LABELS_EXPIRES > time.monotonic() else None
+    if actor is None:
+        return None
+    try:
+        import unreal
+        # A pending-kill actor can still report its old label
+        if unreal.SystemLibrary.is_valid(actor) and actor.get_actor_label() == label:
+            return actor
+    except Exception:
+        pass  # Destroyed since the index was built
+    return None
+
+
+def _rebuild_actor_labels() -> Dict[str, Any]:
+    """Index every level actor by label in one pass"""
+    global _ACTOR_LABELS, _ACTOR_LABELS_EXPIRES
+    labels = {}
+    for actor in actor_subsystem().get_all_level_actors():
+        labels.setdefault(actor.get_actor_label(), actor)
+    with _ACTOR_LABELS_LOCK:
+        _ACTOR_LABELS = labels
+        _ACTOR_LABELS_EXPIRES = time.monotonic() + ACTOR_LABEL_TTL
+    return labels
+
+
+def find_actors_by_labels(labels: Iterable[str]) -> Dict[str, Any]:
+    """Resolve several labels, rescanning the level at most once"""
+    labels = list(labels)
+    found = {}
+    for label in labels:
+        actor = _cached_actor(label)
+        if actor is not None:
+            found[label] = actor
+    if len(found) < len(set(labels)):
+        index = _rebuild_actor_labels()
+        for label in labels:
+            if label not in found and label in index:
+                found[label] = index[label]
+    return found
+
+
+def find_actor_by_label(label: str) -> Optional[Any]:
+    """Level actor with the given Outliner label, or None"""
+    return find_actors_by_labels((label,)).get(label)
@@ -9,13 +9,16 @@ Features:
 - SSE (Server-Sent Events) for async responses
 - Request ID tracking
 - Automatic reconnection
+- Length-prefixed MessagePack bridge framing (falls back to JSON lines)
 """
 
 import json
 import socket
+import struct
 import threading
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Callable
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
@@ -25,6 +28,133 @@ import traceback
 DEFAULT_HTTP_PORT = 8765
 DEFAULT_SOCKET_HOST = "localhost"
 DEFAULT_SOCKET_PORT = 9877
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
+# Optional fast wire format for the proxy <-> socket server bridge
+try:
+    import msgspec
+    _msgpack_encoder = msgspec.msgpack.Encoder()
+    _msgpack_decoder = msgspec.msgpack.Decoder()
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# 4-byte big-endian length header used for msgpack frames
+_FRAME_HEADER = struct.Struct('>I')
+
+# Frames larger than this are treated as corrupt (matches the socket server)
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# Cleared when the socket server answers with an empty frame, meaning it has
+# no msgspec; every later request then uses newline JSON
+_use_msgpack = MSGSPEC_AVAILABLE
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly `size` bytes from a socket"""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 65536))
+        if not chunk:
+            raise ConnectionError("Socket closed mid-frame")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def _build_response(body: bytes, status: str = "200 OK",
+                    content_type: Optional[str] = "application/json",
+                    extra_headers: str = "") -> bytes:
+    """Build a complete HTTP/1.0 response (status line + headers + body)"""
+    head = f"HTTP/1.0 {status}\r\nServer: KarianaUMCP\r\n"
+    if content_type:
+        head += f"Content-Type: {content_type}\r\n"
+    head += (f"Content-Length: {len(body)}\r\n"
+             f"Access-Control-Allow-Origin: *\r\n"
+             f"{extra_headers}\r\n")
+    return head.encode('latin-1') + body
+
+
+# Pre-serialized responses for static endpoints
+_HEALTH_RESPONSE = _build_response(json.dumps({
+    "status": "healthy",
+    "server": "KarianaUMCP",
+    "version": "1.0.0"
+}).encode('utf-8'))
+
+_OPTIONS_RESPONSE = _build_response(
+    b'', content_type=None,
+    extra_headers=("Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+                   "Access-Control-Allow-Headers: Content-Type\r\n"))
+
+if MSGSPEC_AVAILABLE:
+    class _MCPParam(msgspec.Struct):
+        """MCP input schema property"""
+        type: str = "string"
+        description: str = ""
+
+    class _MCPTool(msgspec.Struct):
+        """MCP tool descriptor"""
+        name: str
+        description: str
+        inputSchema: dict
+
+    _json_encoder = msgspec.json.Encoder()
+
+
+def _encode_mcp_tools(functions: list) -> bytes:
+    """Transform socket server functions to MCP tools and encode as JSON"""
+    if MSGSPEC_AVAILABLE:
+        # Structs encode directly, without intermediate per-param dicts
+        tools = [
+            _MCPTool(
+                name=func.get("name"),
+                description=func.get("description", ""),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        k: _MCPParam(type=v.get("type", "string"), description=v.get("description", ""))
+                        for k, v in func.get("parameters", {}).items()
+                    }
+                }
+            )
+            for func in functions
+        ]
+        return _json_encoder.encode({"tools": tools})
+
+    tools = []
+    for func in functions:
+        tools.append({
+            "name": func.get("name"),
+            "description": func.get("description", ""),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    k: {"type": v.get("type", "string"), "description": v.get("description", "")}
+                    for k, v in func.get("parameters", {}).items()
+                }
+            }
+        })
+    return json.dumps({"tools": tools}).encode('utf-8')
+
+
+# Fixed framing around the MCP text content string
+_MCP_TEXT_HEAD = b'{"content": [{"type": "text", "text": '
+_MCP_TEXT_TAIL = b'}]}'
+
+
+def _encode_mcp_text_content(response: Dict) -> bytes:
+    """Encode a tool response as MCP text content (JSON string of the response)"""
+    if MSGSPEC_AVAILABLE:
+        text = _json_encoder.encode(response).decode('utf-8')
+        return _MCP_TEXT_HEAD + _json_encoder.encode(text) + _MCP_TEXT_TAIL
+    return _MCP_TEXT_HEAD + json.dumps(json.dumps(response)).encode('utf-8') + _MCP_TEXT_TAIL
+
+
+# MCP tools list cache (function registry rarely changes while running)
+MCP_TOOLS_CACHE_TTL = 5.0
+_mcp_tools_cache: Optional[tuple] = None  # (expires_at, encoded JSON body)
 
 
 class KarianaMCPRequestHandler(BaseHTTPRequestHandler):
@@ -36,7 +166,10 @@ class KarianaMCPRequestHandler(BaseHTTPRequestHandler):
 
     def send_json_response(self, data: Dict, status: int = 200):
         """Send a JSON response"""
-        response_body = json.dumps(data).encode('utf-8')
+        self.send_json_body(json.dumps(data).encode('utf-8'), status)
+
+    def send_json_body(self, response_body: bytes, status: int = 200):
+        """Send an already encoded JSON body"""
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
         self.send_header('Content-Length', len(response_body))
@@ -44,13 +177,14 @@ class KarianaMCPRequestHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(response_body)
 
+    def _write_cached(self, response: bytes):
+        """Write a pre-built static HTTP response (health, CORS preflight) in a single write"""
+        self.wfile.write(response)
+        self.close_connection = True
+
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+        self._write_cached(_OPTIONS_RESPONSE)
 
     def do_GET(self):
         """Handle GET requests"""
@@ -58,11 +192,7 @@ class KarianaMCPRequestHandler(BaseHTTPRequestHandler):
         path = parsed_path.path
 
         if path == '/health':
-            self.send_json_response({
-                "status": "healthy",
-                "server": "KarianaUMCP",
-                "version": "1.0.0"
-            })
+            self._write_cached(_HEALTH_RESPONSE)
 
         elif path == '/tools/list':
             # Forward to socket server
@@ -70,25 +200,20 @@ class KarianaMCPRequestHandler(BaseHTTPRequestHandler):
             self.send_json_response(response)
 
         elif path == '/mcp/list_tools':
-            # MCP standard endpoint
+            # MCP standard endpoint (served from a short-lived cache)
+            global _mcp_tools_cache
+            cached = _mcp_tools_cache
+            if cached and cached[0] > time.monotonic():
+                self.send_json_body(cached[1])
+                return
+
             response = self._send_to_socket({"type": "list_functions"})
 
             if response.get("success"):
                 # Transform to MCP format
-                tools = []
-                for func in response.get("functions", []):
-                    tools.append({
-                        "name": func.get("name"),
-                        "description": func.get("description", ""),
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                k: {"type": v.get("type", "string"), "description": v.get("description", "")}
-                                for k, v in func.get("parameters", {}).items()
-                            }
-                        }
-                    })
-                self.send_json_response({"tools": tools})
+                body = _encode_mcp_tools(response.get("functions", []))
+                _mcp_tools_cache = (time.monotonic() + MCP_TOOLS_CACHE_TTL, body)
+                self.send_json_body(body)
             else:
                 self.send_json_response(response, 500)
 
@@ -134,9 +259,7 @@ class KarianaMCPRequestHandler(BaseHTTPRequestHandler):
 
             # Transform to MCP format
             if response.get("success"):
-                self.send_json_response({
-                    "content": [{"type": "text", "text": json.dumps(response)}]
-                })
+                self.send_json_body(_encode_mcp_text_content(response))
             else:
                 self.send_json_response({
                     "isError": True,
@@ -153,13 +276,19 @@ class KarianaMCPRequestHandler(BaseHTTPRequestHandler):
 
     def _send_to_socket(self, message: Dict) -> Dict:
         """Send message to socket server and return response"""
+        global _use_msgpack
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(30)  # 30 second timeout
-            sock.connect((DEFAULT_SOCKET_HOST, DEFAULT_SOCKET_PORT))
+            if _use_msgpack:
+                response = self._send_msgpack(message)
+                if response is not None:
+                    return response
+                # Server has no msgspec and did not run the command; use JSON from now on
+                _use_msgpack = False
+
+            sock = self._connect_socket()
 
-            # Send message
-            sock.send((json.dumps(message) + '\n').encode('utf-8'))
+            # Fallback: newline-delimited JSON
+            sock.sendall((json.dumps(message) + '\n').encode('utf-8'))
 
             # Receive response
             response_data = ""
@@ -186,6 +315,31 @@ class KarianaMCPRequestHandler(BaseHTTPRequestHandler):
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _connect_socket(self) -> socket.socket:
+        """Open a connection to the socket server"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(30)  # 30 second timeout
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.connect((DEFAULT_SOCKET_HOST, DEFAULT_SOCKET_PORT))
+        return sock
+
+    def _send_msgpack(self, message: Dict) -> Optional[Dict]:
+        """Exchange one length-prefixed msgpack frame; None if the server rejects msgpack"""
+        sock = self._connect_socket()
+        try:
+            payload = _msgpack_encoder.encode(message)
+            sock.sendall(_FRAME_HEADER.pack(len(payload)) + payload)
+
+            header = _recv_exact(sock, _FRAME_HEADER.size)
+            (length,) = _FRAME_HEADER.unpack(header)
+            if length == 0:
+                return None
+            if length > MAX_FRAME_SIZE:
+                return {"success": False, "error": f"Response frame too large ({length} bytes)"}
+            return _msgpack_decoder.decode(_recv_exact(sock, length))
+        finally:
+            sock.close()
+
     def _handle_sse(self):
         """Handle Server-Sent Events for real-time updates"""
         self.send_response(200)
@@ -209,15 +363,57 @@ class KarianaMCPRequestHandler(BaseHTTPRequestHandler):
             pass  # Client disconnected
 
 
+class _PooledHTTPServer(HTTPServer):
+    """HTTP server that handles requests on a bounded thread pool"""
+
+    allow_reuse_address = True
+
+    def __init__(self, server_address, handler_class, max_workers: int = DEFAULT_MAX_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='kumcp')
+        super().__init__(server_address, handler_class)
+
+    def server_bind(self):
+        """Bind with SO_REUSEPORT where the platform supports it"""
+        try:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        except (AttributeError, OSError):
+            pass
+        super().server_bind()
+
+    def get_request(self):
+        """Accept a connection and disable Nagle for small responses"""
+        conn, addr = super().get_request()
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return conn, addr
+
+    def process_request(self, request, client_address):
+        """Queue the request on the worker pool instead of a new thread"""
+        self._pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False)
+
+
 class NgrokProxy:
     """Manages the HTTP-to-Socket proxy server"""
 
     def __init__(self, http_port: int = DEFAULT_HTTP_PORT,
                  socket_host: str = DEFAULT_SOCKET_HOST,
-                 socket_port: int = DEFAULT_SOCKET_PORT):
+                 socket_port: int = DEFAULT_SOCKET_PORT,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
         self.http_port = http_port
         self.socket_host = socket_host
         self.socket_port = socket_port
+        self.max_workers = max_workers
         self.server = None
         self.running = False
         self.ngrok_url = None
@@ -229,7 +425,8 @@ class NgrokProxy:
             return
 
         try:
-            self.server = HTTPServer(('0.0.0.0', self.http_port), KarianaMCPRequestHandler)
+            self.server = _PooledHTTPServer(('0.0.0.0', self.http_port), KarianaMCPRequestHandler,
+                                            max_workers=self.max_workers)
             self.running = True
 
             # Start server in background thread
@@ -245,14 +442,14 @@ class NgrokProxy:
 
     def _serve(self):
         """Serve HTTP requests"""
-        while self.running:
-            self.server.handle_request()
+        self.server.serve_forever()
 
     def stop(self):
         """Stop the HTTP proxy server"""
         self.running = False
         if self.server:
             self.server.shutdown()
+            self.server.server_close()
         print("KarianaUMCP: HTTP proxy stopped")
 
     def start_ngrok(self, auth_token: Optional[str] = None) -> Optional[str]:
@@ -17,23 +17,77 @@ Supports:
 from typing import Dict, Any, List, Optional
 import traceback
 
+_format_exc = traceback.format_exc
+
+# Default-transform constants (unreal structs are created lazily on first use)
+_ZERO_VEC = None
+_ZERO_ROT = None
+_ZERO_TRIPLE = (0.0, 0.0, 0.0)
+_IDENTITY_SCALE = (1.0, 1.0, 1.0)
+
+
+def _zero_vec():
+    """Return a shared zero unreal.Vector"""
+    global _ZERO_VEC
+    if _ZERO_VEC is None:
+        import unreal
+        _ZERO_VEC = unreal.Vector(0, 0, 0)
+    return _ZERO_VEC
+
+
+def _zero_rot():
+    """Return a shared zero unreal.Rotator"""
+    global _ZERO_ROT
+    if _ZERO_ROT is None:
+        import unreal
+        _ZERO_ROT = unreal.Rotator(0, 0, 0)
+    return _ZERO_ROT
+
+
+# Basic shape meshes (StaticMeshActor + engine mesh)
+_MESH_PATHS = {
+    "Cube": "/Engine/BasicShapes/Cube.Cube",
+    "Sphere": "/Engine/BasicShapes/Sphere.Sphere",
+    "Cylinder": "/Engine/BasicShapes/Cylinder.Cylinder",
+    "Cone": "/Engine/BasicShapes/Cone.Cone",
+    "Plane": "/Engine/BasicShapes/Plane.Plane",
+}
+
+# Loaded mesh assets and StaticMeshComponent class, resolved on first use
+_MESH_ASSET_CACHE: Dict[str, Any] = {}
+_SMC_CLASS = None
+
+
+def _get_mesh(path: str):
+    """Load a mesh asset, reusing previously loaded meshes"""
+    mesh = _MESH_ASSET_CACHE.get(path)
+    if mesh is None:
+        import unreal
+        mesh = unreal.load_asset(path)
+        if mesh:
+            _MESH_ASSET_CACHE[path] = mesh
+    return mesh
+
+
+def _smc_class():
+    """Return the cached unreal.StaticMeshComponent class"""
+    global _SMC_CLASS
+    if _SMC_CLASS is None:
+        import unreal
+        _SMC_CLASS = unreal.StaticMeshComponent
+    return _SMC_CLASS
+
+
+def clear_mesh_cache():
+    """Drop cached mesh assets (call after assets are reloaded in the editor)"""
+    _MESH_ASSET_CACHE.clear()
+
 
 def handle_actor_command(data: Dict[str, Any]) -> Dict[str, Any]:
     """Route actor commands to appropriate handlers"""
     cmd = data.get("type", "")
 
-    handlers = {
-        "spawn_actor": spawn_actor,
-        "delete_actor": delete_actor,
-        "list_actors": list_actors,
-        "get_actor_location": get_actor_location,
-        "set_actor_location": set_actor_location,
-        "set_actor_rotation": set_actor_rotation,
-        "set_actor_scale": set_actor_scale,
-        "modify_actor_property": modify_actor_property,
-    }
-
-    handler = handlers.get(cmd)
+    handler = _HANDLERS.get(cmd)
     if handler:
         try:
             return handler(data)
@@ -41,7 +95,7 @@ def handle_actor_command(data: Dict[str, Any]) -> Dict[str, Any]:
             return {
                 "success": False,
                 "error": str(e),
-                "traceback": traceback.format_exc()
+                "traceback": _format_exc()
             }
     else:
         return {"success": False, "error": f"Unknown actor command: {cmd}"}
@@ -61,16 +115,16 @@ def spawn_actor(data: Dict[str, Any]) -> Dict[str, Any]:
     if not actor_class:
         return {"success": False, "error": "actor_class is required"}
 
-    # Ensure location/rotation/scale are lists
-    if isinstance(location, (list, tuple)) and len(location) >= 3:
+    # Ensure location/rotation/scale are lists (reuse shared zeros for defaults)
+    if isinstance(location, (list, tuple)) and len(location) >= 3 and tuple(location[:3]) != _ZERO_TRIPLE:
         loc = unreal.Vector(float(location[0]), float(location[1]), float(location[2]))
     else:
-        loc = unreal.Vector(0, 0, 0)
+        loc = _zero_vec()
 
-    if isinstance(rotation, (list, tuple)) and len(rotation) >= 3:
+    if isinstance(rotation, (list, tuple)) and len(rotation) >= 3 and tuple(rotation[:3]) != _ZERO_TRIPLE:
         rot = unreal.Rotator(float(rotation[0]), float(rotation[1]), float(rotation[2]))
     else:
-        rot = unreal.Rotator(0, 0, 0)
+        rot = _zero_rot()
 
     # Map common class names to full paths
     class_mapping = {
@@ -133,23 +187,16 @@ def spawn_actor(data: Dict[str, Any]) -> Dict[str, Any]:
             actor.set_actor_label(name)
 
         # Set scale if provided
-        if scale != [1, 1, 1]:
+        if tuple(scale) != _IDENTITY_SCALE:
             scale_vec = unreal.Vector(float(scale[0]), float(scale[1]), float(scale[2]))
             actor.set_actor_scale3d(scale_vec)
 
         # For basic shapes, try to set mesh
-        if actor_class in ["Cube", "Sphere", "Cylinder", "Cone", "Plane"]:
-            mesh_paths = {
-                "Cube": "/Engine/BasicShapes/Cube.Cube",
-                "Sphere": "/Engine/BasicShapes/Sphere.Sphere",
-                "Cylinder": "/Engine/BasicShapes/Cylinder.Cylinder",
-                "Cone": "/Engine/BasicShapes/Cone.Cone",
-                "Plane": "/Engine/BasicShapes/Plane.Plane",
-            }
+        if actor_class in _MESH_PATHS:
             try:
-                mesh_comp = actor.get_component_by_class(unreal.StaticMeshComponent)
+                mesh_comp = actor.get_component_by_class(_smc_class())
                 if mesh_comp:
-                    mesh = unreal.load_asset(mesh_paths[actor_class])
+                    mesh = _get_mesh(_MESH_PATHS[actor_class])
                     if mesh:
                         mesh_comp.set_static_mesh(mesh)
             except:
@@ -443,3 +490,16 @@ def _find_actor_by_name(name: str):
             return actor
 
     return None
+
+
+# Command dispatch table (built once, after all handlers are defined)
+_HANDLERS = {
+    "spawn_actor": spawn_actor,
+    "delete_actor": delete_actor,
+    "list_actors": list_actors,
+    "get_actor_location": get_actor_location,
+    "set_actor_location": set_actor_location,
+    "set_actor_rotation": set_actor_rotation,
+    "set_actor_scale": set_actor_scale,
+    "modify_actor_property": modify_actor_property,
+}
@@ -4,52 +4,114 @@ KarianaUMCP Asset Operations
 Asset management and manipulation tools.
 
 Supports:
-- import_asset
+- import_asset / import_assets
 - list_assets
 - create_material
 - get_asset_info
 - save_asset
-- delete_asset
-- duplicate_asset
+- delete_asset / delete_assets
+- duplicate_asset / duplicate_assets
 """
 
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, Any, List
+import os
+import time
 import traceback
 
+from editor_cache import (
+    asset_listings_generation, asset_registry, asset_tools, invalidate_asset_listings,
+    class_filter as registry_class_filter,
+)
+
+# Imported once at module load; None outside the editor so the module still imports
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+
+# Short-lived list_assets results keyed by the listing parameters. Entries
+# also expire when another command changes assets (see editor_cache).
+LIST_CACHE_TTL = 2.0
+LIST_CACHE_MAX = 64
+_list_cache: Dict[tuple, tuple] = {}  # key -> (expires_at, generation, response)
+
+# Commands that add or remove assets and therefore invalidate cached listings
+_MUTATING_COMMANDS = frozenset({
+    "import_asset", "import_assets", "create_material",
+    "delete_asset", "delete_assets", "duplicate_asset", "duplicate_assets",
+})
+
+def _new_import_task(source_path: str, destination_path: str, asset_name: str):
+    """Build an automated, replacing, saving AssetImportTask for one file"""
+    task = unreal.AssetImportTask()
+    task.set_editor_property('automated', True)
+    task.set_editor_property('replace_existing', True)
+    task.set_editor_property('save', True)
+    task.set_editor_property('destination_path', destination_path)
+    task.set_editor_property('destination_name', asset_name)
+    task.set_editor_property('filename', source_path)
+    return task
+
+
+# Content root prefixes (tuple form lets startswith check all in one call)
+_GAME_PREFIX = "/Game"
+_ENGINE_PREFIX = "/Engine"
+_VALID_PREFIXES = (_GAME_PREFIX, _ENGINE_PREFIX)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_asset_path(path: str) -> str:
+    """Prefix /Game unless the path is already under /Game or /Engine"""
+    if path.startswith(_VALID_PREFIXES):
+        return path
+    return "/Game/" + path
+
+
+@lru_cache(maxsize=4096)
+def _normalize_game_path(path: str) -> str:
+    """Prefix /Game unless the path is already under /Game"""
+    if path.startswith(_GAME_PREFIX):
+        return path
+    return "/Game/" + path
+
+
+def _get_path(data: Dict[str, Any]) -> str:
+    """Asset path from either the asset_path or path parameter"""
+    return data.get("asset_path") or data.get("path") or ""
+
 
 def handle_asset_command(data: Dict[str, Any]) -> Dict[str, Any]:
     """Route asset commands to appropriate handlers"""
     cmd = data.get("type", "")
+    handler = _HANDLERS_GET(cmd, _unknown_command)
+    try:
+        return handler(data)
+    except Exception as e:
+        response = {
+            "success": False,
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+        # Formatting a traceback is costly; only do it when asked
+        if data.get("include_traceback", False):
+            response["traceback"] = traceback.format_exc()
+        return response
+    finally:
+        # Any mutation may change directory listings
+        if cmd in _MUTATING_COMMANDS:
+            invalidate_asset_listings()
 
-    handlers = {
-        "import_asset": import_asset,
-        "list_assets": list_assets,
-        "create_material": create_material,
-        "get_asset_info": get_asset_info,
-        "save_asset": save_asset,
-        "delete_asset": delete_asset,
-        "duplicate_asset": duplicate_asset,
-    }
 
-    handler = handlers.get(cmd)
-    if handler:
-        try:
-            return handler(data)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }
-    else:
-        return {"success": False, "error": f"Unknown asset command: {cmd}"}
+def _unknown_command(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fallback handler for unrecognized asset commands"""
+    return {"success": False, "error": f"Unknown asset command: {data.get('type', '')}"}
 
 
 def import_asset(data: Dict[str, Any]) -> Dict[str, Any]:
     """Import an asset from file"""
-    import unreal
-    import os
-
     source_path = data.get("source_path", "")
     destination_path = data.get("destination_path", "/Game/Imported")
     asset_name = data.get("asset_name", "")
@@ -57,38 +119,21 @@ def import_asset(data: Dict[str, Any]) -> Dict[str, Any]:
     if not source_path:
         return {"success": False, "error": "source_path is required"}
 
-    if not os.path.exists(source_path):
+    if not _source_exists(source_path):
         return {"success": False, "error": f"Source file not found: {source_path}"}
 
     # Auto-detect asset name from filename
     if not asset_name:
-        asset_name = os.path.splitext(os.path.basename(source_path))[0]
+        asset_name = _default_asset_name(source_path)
 
     try:
-        # Create import task
-        task = unreal.AssetImportTask()
-        task.set_editor_property('automated', True)
-        task.set_editor_property('destination_path', destination_path)
-        task.set_editor_property('destination_name', asset_name)
-        task.set_editor_property('filename', source_path)
-        task.set_editor_property('replace_existing', True)
-        task.set_editor_property('save', True)
-
-        # Execute import
-        asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-        asset_tools.import_asset_tasks([task])
-
-        imported_path = f"{destination_path}/{asset_name}"
-
-        # Verify import
-        imported_asset = unreal.load_asset(imported_path)
-        if imported_asset:
-            return {
-                "success": True,
-                "asset": asset_name,
-                "path": imported_path,
-                "source": source_path
-            }
+        result = _run_import_tasks(
+            [(source_path, destination_path, asset_name)],
+            verify=data.get("verify", False)
+        )[0]
+
+        if result["success"]:
+            return result
         else:
             return {
                 "success": False,
@@ -99,48 +144,182 @@ def import_asset(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": f"Import failed: {e}"}
 
 
+def import_assets(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Import several files with a single import_asset_tasks call"""
+    imports = data.get("imports", [])
+
+    if not imports:
+        return {"success": False, "error": "imports list is required"}
+
+    # Validate every entry before touching the editor
+    entries = []
+    invalid = []
+    for item in imports:
+        source_path = item.get("source_path", "")
+        if not source_path or not _source_exists(source_path):
+            invalid.append(source_path)
+            continue
+        asset_name = item.get("asset_name", "") or _default_asset_name(source_path)
+        entries.append((source_path, item.get("destination_path", "/Game/Imported"), asset_name))
+
+    if invalid:
+        return {"success": False, "error": "Source file(s) not found", "missing": invalid}
+
+    try:
+        results = _run_import_tasks(entries, verify=data.get("verify", False))
+        imported = [r for r in results if r["success"]]
+
+        return {
+            "success": len(imported) == len(results),
+            "imported": imported,
+            "failed": [r["source"] for r in results if not r["success"]],
+            "count": len(imported)
+        }
+
+    except Exception as e:
+        return {"success": False, "error": f"Import failed: {e}"}
+
+
+def _source_exists(source_path: str) -> bool:
+    """Single stat() call in place of os.path.exists"""
+    try:
+        os.stat(source_path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _default_asset_name(source_path: str) -> str:
+    """Filename without its extension; dotfiles such as .hidden keep their full name"""
+    basename = os.path.basename(source_path)
+    return os.path.splitext(basename)[0] or basename
+
+
+def _run_import_tasks(entries: List[tuple], verify: bool = False) -> List[Dict[str, Any]]:
+    """Import (source_path, destination_path, asset_name) entries in one batch.
+
+    Success is read from each task's imported_object_paths; with verify=True
+    the asset registry is also checked for the destination path.
+    """
+    # Fresh tasks each time: building one is negligible next to the import,
+    # and a reused task would carry over the previous run's results
+    tasks = [_new_import_task(*entry) for entry in entries]
+
+    # Execute all imports in one editor pass
+    asset_tools().import_asset_tasks(tasks)
+    imported_counts = [len(task.get_editor_property('imported_object_paths')) for task in tasks]
+
+    results = []
+    for (source_path, destination_path, asset_name), imported_count in zip(entries, imported_counts):
+        imported_path = destination_path + "/" + asset_name
+
+        # Verify import (registry lookup only; the asset is not loaded)
+        if verify:
+            success = unreal.EditorAssetLibrary.does_asset_exist(imported_path)
+        else:
+            success = imported_count > 0
+
+        results.append({
+            "success": bool(success),
+            "asset": asset_name,
+            "path": imported_path,
+            "source": source_path
+        })
+
+    return results
+
+
+def _store_listing(cache_key: tuple, response: Dict[str, Any]):
+    """Cache a listing, first evicting stale entries and, at capacity, the oldest"""
+    now = time.monotonic()
+    generation = asset_listings_generation()
+    for key in [k for k, entry in _list_cache.items() if entry[0] <= now or entry[1] != generation]:
+        del _list_cache[key]
+    if len(_list_cache) >= LIST_CACHE_MAX:
+        del _list_cache[next(iter(_list_cache))]
+    _list_cache[cache_key] = (now + LIST_CACHE_TTL, generation, response)
+
+
+def _copy_listing(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a cached listing, so callers cannot alter what later hits see"""
+    return {**response, "assets": [dict(row) for row in response["assets"]]}
+
+
 def list_assets(data: Dict[str, Any]) -> Dict[str, Any]:
     """List assets in a directory"""
-    import unreal
-
     path = data.get("path", "/Game")
     recursive = data.get("recursive", True)
     class_filter = data.get("class_filter", "")
+    exact_match = data.get("exact_match", False)
     limit = data.get("limit", 100)
 
     # Normalize path
-    if not path.startswith("/Game"):
-        path = f"/Game/{path}"
+    path = _normalize_game_path(path)
+
+    # Serve repeat listings from the TTL cache
+    cache_key = (path, recursive, class_filter, exact_match, limit)
+    cached = _list_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic() and cached[1] == asset_listings_generation():
+        return _copy_listing(cached[2])
 
     try:
-        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        registry = asset_registry()
 
         # Get assets
-        assets = asset_registry.get_assets_by_path(path, recursive)
-
-        result = []
-        for asset_data in assets:
-            if len(result) >= limit:
-                break
-
-            asset_class = str(asset_data.asset_class_path.asset_name) if hasattr(asset_data, 'asset_class_path') else str(asset_data.asset_class)
-
-            # Apply class filter
-            if class_filter and class_filter.lower() not in asset_class.lower():
-                continue
-
-            result.append({
-                "name": str(asset_data.asset_name),
-                "path": str(asset_data.package_name),
-                "class": asset_class
-            })
+        if class_filter and exact_match:
+            # Exact class names can be filtered natively by the registry
+            ar_filter = unreal.ARFilter(
+                package_paths=[path],
+                recursive_paths=recursive,
+                **registry_class_filter(class_filter)
+            )
+            assets = registry.get_assets(ar_filter)
+            class_filter = ""
+        else:
+            assets = registry.get_assets_by_path(path, recursive)
+
+        # Precompute filter state once instead of per asset
+        cf = class_filter.lower() if class_filter else None
+        limit = max(int(limit), 0)
+        has_class_path = bool(assets) and getattr(assets[0], 'asset_class_path', None) is not None
+
+        # Without a filter only the first `limit` assets are ever needed
+        candidates = islice(assets, limit) if cf is None else assets
+
+        # Preallocate the result (at most `limit` rows) and fill by index
+        n = min(limit, len(assets))
+        result = [None] * n
+        _str = str
+        idx = 0
+        if n:
+            for asset_data in candidates:
+                if has_class_path:
+                    asset_class = _str(asset_data.asset_class_path.asset_name)
+                else:
+                    asset_class = _str(asset_data.asset_class)
+
+                # Apply class filter
+                if cf is not None and cf not in asset_class.lower():
+                    continue
+
+                result[idx] = {
+                    "name": _str(asset_data.asset_name),
+                    "path": _str(asset_data.package_name),
+                    "class": asset_class
+                }
+                idx += 1
+                if idx >= n:
+                    break
+        del result[idx:]
 
-        return {
+        response = {
             "success": True,
             "assets": result,
             "count": len(result),
             "path": path
         }
+        _store_listing(cache_key, response)
+        return _copy_listing(response)
 
     except Exception as e:
         return {"success": False, "error": f"Failed to list assets: {e}"}
@@ -148,23 +327,20 @@ def list_assets(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def create_material(data: Dict[str, Any]) -> Dict[str, Any]:
     """Create a new material"""
-    import unreal
-
     name = data.get("name", "NewMaterial")
     path = data.get("path", "/Game/Materials")
     base_color = data.get("base_color", [1, 1, 1, 1])
     metallic = data.get("metallic", 0.0)
     roughness = data.get("roughness", 0.5)
 
-    full_path = f"{path}/{name}"
+    full_path = path + "/" + name
 
     try:
         # Create material factory
         factory = unreal.MaterialFactoryNew()
 
         # Create the material
-        asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-        material = asset_tools.create_asset(name, path, unreal.Material, factory)
+        material = asset_tools().create_asset(name, path, unreal.Material, factory)
 
         if not material:
             return {"success": False, "error": "Failed to create material"}
@@ -188,34 +364,47 @@ def create_material(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def get_asset_info(data: Dict[str, Any]) -> Dict[str, Any]:
     """Get information about an asset"""
-    import unreal
-
-    asset_path = data.get("asset_path", "") or data.get("path", "")
+    asset_path = _get_path(data)
 
     if not asset_path:
         return {"success": False, "error": "asset_path is required"}
 
     # Normalize path
-    if not asset_path.startswith("/Game") and not asset_path.startswith("/Engine"):
-        asset_path = f"/Game/{asset_path}"
+    asset_path = _normalize_asset_path(asset_path)
 
-    try:
-        # Load the asset
-        asset = unreal.load_asset(asset_path)
+    # Lazy mode only loads the asset when type-specific details need it
+    lazy = data.get("lazy", True)
 
-        if not asset:
+    try:
+        # Existence check and name/class via the registry (no load)
+        if not unreal.EditorAssetLibrary.does_asset_exist(asset_path):
             return {"success": False, "error": f"Asset not found: {asset_path}"}
 
+        asset_data = unreal.EditorAssetLibrary.find_asset_data(asset_path)
+        class_path = getattr(asset_data, 'asset_class_path', None)
+        if class_path is not None:
+            asset_class = str(class_path.asset_name)
+        else:
+            asset_class = str(asset_data.asset_class)
+
         info = {
             "success": True,
             "path": asset_path,
-            "name": asset.get_name(),
-            "class": asset.get_class().get_name(),
+            "name": str(asset_data.asset_name),
+            "class": asset_class,
         }
 
-        # Try to get additional info based on asset type
-        asset_class = asset.get_class().get_name()
+        needs_load = "Texture" in asset_class or "StaticMesh" in asset_class
+        if lazy and not needs_load:
+            return info
 
+        # Load the asset
+        asset = unreal.load_asset(asset_path)
+
+        if not asset:
+            return {"success": False, "error": f"Asset not found: {asset_path}"}
+
+        # Try to get additional info based on asset type
         if "Texture" in asset_class:
             try:
                 info["size"] = {
@@ -239,16 +428,13 @@ def get_asset_info(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def save_asset(data: Dict[str, Any]) -> Dict[str, Any]:
     """Save an asset"""
-    import unreal
-
-    asset_path = data.get("asset_path", "") or data.get("path", "")
+    asset_path = _get_path(data)
 
     if not asset_path:
         return {"success": False, "error": "asset_path is required"}
 
     # Normalize path
-    if not asset_path.startswith("/Game"):
-        asset_path = f"/Game/{asset_path}"
+    asset_path = _normalize_game_path(asset_path)
 
     try:
         success = unreal.EditorAssetLibrary.save_asset(asset_path)
@@ -268,16 +454,13 @@ def save_asset(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def delete_asset(data: Dict[str, Any]) -> Dict[str, Any]:
     """Delete an asset"""
-    import unreal
-
-    asset_path = data.get("asset_path", "") or data.get("path", "")
+    asset_path = _get_path(data)
 
     if not asset_path:
         return {"success": False, "error": "asset_path is required"}
 
     # Normalize path
-    if not asset_path.startswith("/Game"):
-        asset_path = f"/Game/{asset_path}"
+    asset_path = _normalize_game_path(asset_path)
 
     try:
         # Check if asset exists
@@ -301,8 +484,6 @@ def delete_asset(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def duplicate_asset(data: Dict[str, Any]) -> Dict[str, Any]:
     """Duplicate an asset"""
-    import unreal
-
     source_path = data.get("source_path", "")
     destination_path = data.get("destination_path", "")
 
@@ -313,10 +494,8 @@ def duplicate_asset(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": "destination_path is required"}
 
     # Normalize paths
-    if not source_path.startswith("/Game"):
-        source_path = f"/Game/{source_path}"
-    if not destination_path.startswith("/Game"):
-        destination_path = f"/Game/{destination_path}"
+    source_path = _normalize_game_path(source_path)
+    destination_path = _normalize_game_path(destination_path)
 
     try:
         # Duplicate
@@ -333,3 +512,103 @@ def duplicate_asset(data: Dict[str, Any]) -> Dict[str, Any]:
 
     except Exception as e:
         return {"success": False, "error": f"Duplicate failed: {e}"}
+
+
+def delete_assets(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Delete several assets with one delete_loaded_assets call"""
+    asset_paths = data.get("asset_paths", [])
+
+    if not asset_paths:
+        return {"success": False, "error": "asset_paths list is required"}
+
+    results = []
+    to_delete = []  # (result, path, asset) for assets handed to the batch delete
+    try:
+        for asset_path in asset_paths:
+            asset_path = _normalize_game_path(asset_path)
+            result = {"path": asset_path, "success": False}
+            results.append(result)
+            if not unreal.EditorAssetLibrary.does_asset_exist(asset_path):
+                result["error"] = "Asset not found"
+                continue
+            asset = unreal.load_asset(asset_path)
+            if not asset:
+                result["error"] = "Failed to load asset"
+                continue
+            to_delete.append((result, asset_path, asset))
+
+        if to_delete:
+            # One reference check and package cleanup for the whole batch;
+            # the call only reports overall success, so check each path after
+            unreal.EditorAssetLibrary.delete_loaded_assets([asset for _, _, asset in to_delete])
+            for result, asset_path, _ in to_delete:
+                result["success"] = not unreal.EditorAssetLibrary.does_asset_exist(asset_path)
+                if not result["success"]:
+                    result["error"] = "Delete failed"
+
+    except Exception as e:
+        return {"success": False, "error": f"Delete failed: {e}", "results": results}
+
+    deleted = sum(1 for r in results if r["success"])
+    return {
+        "success": deleted == len(results),
+        "results": results,
+        "deleted": deleted
+    }
+
+
+def duplicate_assets(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Duplicate several assets in one call"""
+    duplicates = data.get("duplicates", [])
+
+    if not duplicates:
+        return {"success": False, "error": "duplicates list is required"}
+
+    results = []
+    try:
+        for item in duplicates:
+            source_path = item.get("source_path", "")
+            destination_path = item.get("destination_path", "")
+            if not source_path or not destination_path:
+                results.append({
+                    "source": source_path,
+                    "destination": destination_path,
+                    "success": False,
+                    "error": "source_path and destination_path are required"
+                })
+                continue
+
+            source_path = _normalize_game_path(source_path)
+            destination_path = _normalize_game_path(destination_path)
+            success = unreal.EditorAssetLibrary.duplicate_asset(source_path, destination_path)
+            results.append({
+                "source": source_path,
+                "destination": destination_path,
+                "success": bool(success)
+            })
+
+    except Exception as e:
+        return {"success": False, "error": f"Duplicate failed: {e}", "results": results}
+
+    duplicated = sum(1 for r in results if r["success"])
+    return {
+        "success": duplicated == len(results),
+        "results": results,
+        "duplicated": duplicated
+    }
+
+
+# Command dispatch table (built once, after all handlers are defined)
+_HANDLERS = {
+    "import_asset": import_asset,
+    "import_assets": import_assets,
+    "list_assets": list_assets,
+    "create_material": create_material,
+    "get_asset_info": get_asset_info,
+    "save_asset": save_asset,
+    "delete_asset": delete_asset,
+    "delete_assets": delete_assets,
+    "duplicate_asset": duplicate_asset,
+    "duplicate_assets": duplicate_assets,
+}
+_HANDLERS_GET = _HANDLERS.get
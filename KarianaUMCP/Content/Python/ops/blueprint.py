@@ -10,49 +10,243 @@ Supports:
 - compile_blueprint
 - open_blueprint_editor
 - create_blueprint_from_actor
+- set_component_property
+- set_component_transform
+- get_blueprint_components
+- batch_blueprint_edit
+- add_blueprint_components_bulk
+- get_blueprint_info_many
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
+import os
+import threading
+import time
 import traceback
 
+from editor_cache import asset_tools, find_actor_by_label, invalidate_asset_listings
 
-def handle_blueprint_command(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Route blueprint commands to appropriate handlers"""
-    cmd = data.get("type", "")
-
-    handlers = {
-        "create_blueprint": create_blueprint,
-        "add_blueprint_component": add_blueprint_component,
-        "get_blueprint_info": get_blueprint_info,
-        "compile_blueprint": compile_blueprint,
-        "open_blueprint_editor": open_blueprint_editor,
-        "create_blueprint_from_actor": create_blueprint_from_actor,
-        "set_component_property": set_component_property,
-        "set_component_transform": set_component_transform,
-        "get_blueprint_components": get_blueprint_components,
+# Imported once at module load; None outside the editor so the module still imports
+try:
+    import unreal
+except ImportError:
+    unreal = None
+
+
+# Full tracebacks in error responses; formatting them walks the stack and
+# reads source files, so they are off unless debugging
+_DEBUG = os.environ.get("KARIANAUMCP_DEBUG") == "1"
+
+
+def _error_response(message: str, e: Exception, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Failure response for a caught exception; call from inside the except block"""
+    response = {
+        "success": False,
+        "error": f"{message}: {e}" if message else str(e),
+        "error_type": type(e).__name__
+    }
+    if _DEBUG or data.get("include_traceback", False):
+        response["traceback"] = traceback.format_exc()
+    return response
+
+
+# Common parent class names -> class paths
+_PARENT_CLASS_MAP = MappingProxyType({
+    "Actor": "/Script/Engine.Actor",
+    "Pawn": "/Script/Engine.Pawn",
+    "Character": "/Script/Engine.Character",
+    "PlayerController": "/Script/Engine.PlayerController",
+    "GameModeBase": "/Script/Engine.GameModeBase",
+    "ActorComponent": "/Script/Engine.ActorComponent",
+    "SceneComponent": "/Script/Engine.SceneComponent",
+})
+
+
+@lru_cache(maxsize=256)
+def _get_component_static_class(name: str):
+    """Resolve a component type name (e.g. StaticMeshComponent) to its UClass once"""
+    cls = getattr(unreal, name, None)
+    static_class = getattr(cls, "static_class", None)
+    return static_class() if static_class else None
+
+
+@lru_cache(maxsize=64)
+def _editor_properties(cls) -> frozenset:
+    """Attribute names exposed by a wrapped UClass, gathered once per class"""
+    return frozenset(dir(cls))
+
+
+def _has_property(template, name: str) -> bool:
+    """Membership test against the cached attribute set instead of hasattr"""
+    return name in _editor_properties(type(template))
+
+
+# Editor subsystems live for the whole editor session, so resolve them once.
+# Prefer these over the legacy EditorLevelLibrary wrappers; that library is
+# only used for create_blueprint_from_actor, which has no subsystem equivalent.
+_SDS_SINGLETON = None
+_ASSET_EDITOR = None
+
+
+def _sds():
+    """SubobjectDataSubsystem, looked up on first use"""
+    global _SDS_SINGLETON
+    if _SDS_SINGLETON is None:
+        _SDS_SINGLETON = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+    return _SDS_SINGLETON
+
+
+def _asset_editor():
+    """AssetEditorSubsystem, looked up on first use"""
+    global _ASSET_EDITOR
+    if _ASSET_EDITOR is None:
+        _ASSET_EDITOR = unreal.get_editor_subsystem(unreal.AssetEditorSubsystem)
+    return _ASSET_EDITOR
+
+
+# Loaded Blueprints, their subobject handle index and component summaries,
+# keyed by asset path.
+# Writes through this module invalidate an entry; the TTL bounds staleness
+# from edits made elsewhere in the editor.
+BP_CACHE_TTL = 5.0
+_BP_CACHE: Dict[str, list] = {}  # path -> [expires_at, blueprint, handle index, component summaries]
+_BP_CACHE_LOCK = threading.Lock()
+
+
+def _load_blueprint(blueprint_path: str):
+    """Load a Blueprint asset, reusing a recently loaded instance"""
+    now = time.monotonic()
+    with _BP_CACHE_LOCK:
+        entry = _BP_CACHE.get(blueprint_path)
+        if entry and entry[0] > now:
+            return entry[1]
+
+    blueprint = unreal.load_asset(blueprint_path)
+    if blueprint:
+        with _BP_CACHE_LOCK:
+            _BP_CACHE[blueprint_path] = [now + BP_CACHE_TTL, blueprint, None, None]
+    return blueprint
+
+
+def _build_handle_index(sds, blueprint) -> Dict[str, tuple]:
+    """Walk a Blueprint's subobjects once.
+
+    Returns {display_name: (handle, subobject_data, is_root, is_component, template)};
+    the first subobject with a given name wins.
+    """
+    sdbfl = unreal.SubobjectDataBlueprintFunctionLibrary
+    index = {}
+    for h in sds.k2_gather_subobject_data_for_blueprint(blueprint):
+        sd = sds.k2_find_subobject_data_from_handle(h)
+        if not sd:
+            continue
+        name = str(sdbfl.get_display_name(sd))  # Convert Text to string
+        if name not in index:
+            index[name] = (h, sd, sdbfl.is_root_component(sd), sdbfl.is_component(sd), sdbfl.get_object(sd))
+    return index
+
+
+def _get_handle_index(sds, blueprint, blueprint_path: str) -> Dict[str, tuple]:
+    """Subobject handle index for a Blueprint, reusing a cached snapshot"""
+    with _BP_CACHE_LOCK:
+        entry = _BP_CACHE.get(blueprint_path)
+        if entry and entry[1] is blueprint and entry[2] is not None and entry[0] > time.monotonic():
+            return entry[2]
+
+    index = _build_handle_index(sds, blueprint)
+    with _BP_CACHE_LOCK:
+        entry = _BP_CACHE.get(blueprint_path)
+        if entry and entry[1] is blueprint:
+            entry[2] = index
+    return index
+
+
+def _summarize_component(name: str, entry: tuple) -> Dict[str, Any]:
+    """Name, class, root flag and location of one indexed component"""
+    template = entry[4]
+    comp_info = {
+        "name": name,
+        "type": template.get_class().get_name() if template else "Unknown",
+        "is_root": entry[2]
     }
 
-    handler = handlers.get(cmd)
-    if handler:
+    # Get transform if available
+    if template and _has_property(template, 'relative_location'):
         try:
-            return handler(data)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }
-    else:
-        return {"success": False, "error": f"Unknown blueprint command: {cmd}"}
+            loc = template.get_editor_property('relative_location')
+            comp_info["location"] = {"x": loc.x, "y": loc.y, "z": loc.z}
+        except (AttributeError, RuntimeError):
+            pass
+
+    return comp_info
+
+
+def _get_component_summaries(sds, blueprint, blueprint_path: str) -> List[Dict[str, Any]]:
+    """Component summaries for a Blueprint, reusing those built from the cached index"""
+    index = _get_handle_index(sds, blueprint, blueprint_path)
+    with _BP_CACHE_LOCK:
+        entry = _BP_CACHE.get(blueprint_path)
+        if entry and entry[2] is index and entry[3] is not None:
+            return entry[3]
+
+    # Skip non-component entries (like the actor itself)
+    components = [_summarize_component(name, e) for name, e in index.items() if e[3]]
+    with _BP_CACHE_LOCK:
+        entry = _BP_CACHE.get(blueprint_path)
+        if entry and entry[2] is index:
+            entry[3] = components
+    return components
+
+
+def _normalize_bp_path(data: Dict[str, Any]) -> Optional[str]:
+    """Blueprint path from a request, rooted under /Game; None if missing"""
+    path = data.get("blueprint_path") or data.get("path")
+    if not path:
+        return None
+    if path[:5] == "/Game":
+        return path
+    return "/Game/" + path
+
+
+def _ensure_bp_path(data: Dict[str, Any]):
+    """Return (path, None), or (None, error response) when no path was given"""
+    path = _normalize_bp_path(data)
+    if path is None:
+        return None, {"success": False, "error": "blueprint_path is required"}
+    return path, None
+
+
+def _invalidate_blueprint(blueprint_path: str):
+    """Drop cached state for a Blueprint after it has been modified"""
+    with _BP_CACHE_LOCK:
+        _BP_CACHE.pop(blueprint_path, None)
+
+
+def handle_blueprint_command(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Route blueprint commands to appropriate handlers"""
+    handler = _HANDLERS_GET(data.get("type", ""), _unknown_command)
+    try:
+        return handler(data)
+    except Exception as e:
+        return _error_response("", e, data)
+    finally:
+        if handler in _CREATING_HANDLERS:
+            invalidate_asset_listings()
+
+
+def _unknown_command(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fallback handler for unrecognized blueprint commands"""
+    return {"success": False, "error": f"Unknown blueprint command: {data.get('type', '')}"}
 
 
 def create_blueprint(data: Dict[str, Any]) -> Dict[str, Any]:
     """Create a new Blueprint"""
-    import unreal
-
     name = data.get("name", "NewBlueprint")
     path = data.get("path", "/Game/Blueprints")
     parent_class = data.get("parent_class", "Actor")
+    open_editor = data.get("open_editor", False)
 
     # Ensure path ends with the blueprint name
     if not path.endswith(name):
@@ -60,18 +254,7 @@ def create_blueprint(data: Dict[str, Any]) -> Dict[str, Any]:
     else:
         full_path = path
 
-    # Map common parent class names
-    class_mapping = {
-        "Actor": "/Script/Engine.Actor",
-        "Pawn": "/Script/Engine.Pawn",
-        "Character": "/Script/Engine.Character",
-        "PlayerController": "/Script/Engine.PlayerController",
-        "GameModeBase": "/Script/Engine.GameModeBase",
-        "ActorComponent": "/Script/Engine.ActorComponent",
-        "SceneComponent": "/Script/Engine.SceneComponent",
-    }
-
-    parent_path = class_mapping.get(parent_class, f"/Script/Engine.{parent_class}")
+    parent_path = _PARENT_CLASS_MAP.get(parent_class, f"/Script/Engine.{parent_class}")
 
     try:
         # Load parent class
@@ -83,27 +266,27 @@ def create_blueprint(data: Dict[str, Any]) -> Dict[str, Any]:
         factory = unreal.BlueprintFactory()
         factory.set_editor_property("parent_class", parent)  # Use set_editor_property for UE5
 
-        asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-        blueprint = asset_tools.create_asset(name, path, None, factory)  # Let factory determine class
+        blueprint = asset_tools().create_asset(name, path, None, factory)  # Let factory determine class
 
         if not blueprint:
             return {"success": False, "error": "Failed to create Blueprint"}
 
         # Compile and save - use BlueprintEditorLibrary (not KismetSystemLibrary)
         unreal.BlueprintEditorLibrary.compile_blueprint(blueprint)
-        unreal.EditorAssetLibrary.save_asset(full_path)
+        unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
+        _invalidate_blueprint(full_path)
 
-        # Auto-open in editor
-        asset_editor = unreal.get_editor_subsystem(unreal.AssetEditorSubsystem)
-        asset_editor.open_editor_for_assets([blueprint])  # UE5 uses plural form with array
+        # Opening the editor builds the whole Blueprint editor UI, so only on request
+        if open_editor:
+            _asset_editor().open_editor_for_assets([blueprint])  # UE5 uses plural form with array
 
         return {
             "success": True,
             "blueprint": name,
             "path": full_path,
             "parent_class": parent_class,
-            "opened": True,
-            "message": "Blueprint created and opened in editor"
+            "opened": open_editor,
+            "message": "Blueprint created and opened in editor" if open_editor else "Blueprint created"
         }
 
     except Exception as e:
@@ -112,23 +295,13 @@ def create_blueprint(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def add_blueprint_component(data: Dict[str, Any]) -> Dict[str, Any]:
     """Add a component to a Blueprint using UE5 SubobjectDataSubsystem"""
-    import unreal
-
-    blueprint_path = data.get("blueprint_path", "")
-    component_type = data.get("component_class", "") or data.get("component_type", "StaticMeshComponent")
-    component_name = data.get("component_name", "") or data.get("name", "NewComponent")
-    parent_component = data.get("parent", None)
-
-    if not blueprint_path:
-        return {"success": False, "error": "blueprint_path is required"}
-
-    # Normalize path
-    if not blueprint_path.startswith("/Game"):
-        blueprint_path = f"/Game/{blueprint_path}"
+    blueprint_path, error = _ensure_bp_path(data)
+    if error:
+        return error
 
     try:
         # Load the Blueprint
-        blueprint = unreal.load_asset(blueprint_path)
+        blueprint = _load_blueprint(blueprint_path)
         if not blueprint:
             return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
 
@@ -137,121 +310,122 @@ def add_blueprint_component(data: Dict[str, Any]) -> Dict[str, Any]:
             return {"success": False, "error": f"Asset is not a Blueprint: {blueprint_path}"}
 
         # Get SubobjectDataSubsystem - UE5's API for adding components to blueprints
-        sds = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+        sds = _sds()
         if not sds:
             return {"success": False, "error": "Failed to get SubobjectDataSubsystem"}
 
-        # Map component class names to unreal classes
-        class_mapping = {
-            "StaticMeshComponent": unreal.StaticMeshComponent,
-            "SkeletalMeshComponent": unreal.SkeletalMeshComponent,
-            "SceneComponent": unreal.SceneComponent,
-            "PointLightComponent": unreal.PointLightComponent,
-            "SpotLightComponent": unreal.SpotLightComponent,
-            "DirectionalLightComponent": unreal.DirectionalLightComponent,
-            "CameraComponent": unreal.CameraComponent,
-            "BoxComponent": unreal.BoxComponent,
-            "SphereComponent": unreal.SphereComponent,
-            "CapsuleComponent": unreal.CapsuleComponent,
-            "ArrowComponent": unreal.ArrowComponent,
-            "AudioComponent": unreal.AudioComponent,
-            "ChildActorComponent": unreal.ChildActorComponent,
-            "TextRenderComponent": unreal.TextRenderComponent,
-            "BillboardComponent": unreal.BillboardComponent,
-            "SpringArmComponent": unreal.SpringArmComponent,
-        }
-
-        # Get component class
-        comp_class = class_mapping.get(component_type)
-        if not comp_class:
-            # Try to get the class dynamically
-            try:
-                comp_class = getattr(unreal, component_type, None)
-            except AttributeError:
-                pass
-
-        if not comp_class:
-            return {"success": False, "error": f"Component class not found: {component_type}"}
-
-        # Get existing subobjects to find root handle
-        handles = sds.k2_gather_subobject_data_for_blueprint(blueprint)
-        root_handle = None
-
-        for h in handles:
-            sd = sds.k2_find_subobject_data_from_handle(h)
-            if sd and unreal.SubobjectDataBlueprintFunctionLibrary.is_root_component(sd):
-                root_handle = h
-                break
-
-        # Find parent handle if specified
-        parent_handle = root_handle  # Default to root
-        if parent_component:
-            for h in handles:
-                sd = sds.k2_find_subobject_data_from_handle(h)
-                if sd:
-                    name = unreal.SubobjectDataBlueprintFunctionLibrary.get_display_name(sd)
-                    if name == parent_component:
-                        parent_handle = h
-                        break
-
-        # Create params for adding new subobject
-        params = unreal.AddNewSubobjectParams()
-        params.set_editor_property('blueprint_context', blueprint)
-        params.set_editor_property('new_class', comp_class.static_class())
-        if parent_handle:
-            params.set_editor_property('parent_handle', parent_handle)
-
-        # Add the component
-        new_handle, fail_reason = sds.add_new_subobject(params)
-
-        # fail_reason is Text type - check if it has content
-        fail_str = str(fail_reason) if fail_reason else ""
-        if fail_str and fail_str.strip():
-            return {"success": False, "error": f"Failed to add component: {fail_str}"}
+        index = _get_handle_index(sds, blueprint, blueprint_path)
+        result = _apply_add_component(blueprint, blueprint_path, sds, index, data)
+        if not result["success"]:
+            return result
 
         # Compile blueprint to apply changes
         unreal.BlueprintEditorLibrary.compile_blueprint(blueprint)
 
         # Save the blueprint
-        unreal.EditorAssetLibrary.save_asset(blueprint_path)
+        unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
+        _invalidate_blueprint(blueprint_path)
 
-        # Re-open editor to show changes
-        asset_editor = unreal.get_editor_subsystem(unreal.AssetEditorSubsystem)
-        asset_editor.open_editor_for_assets([blueprint])
-
-        return {
-            "success": True,
-            "blueprint": blueprint_path,
-            "component": component_name,
-            "component_type": component_type,
-            "parent": parent_component,
-            "message": f"Added {component_type} '{component_name}' to blueprint and opened editor"
-        }
+        # An open Blueprint editor refreshes on compile; no need to reopen it
+        return result
 
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Failed to add component: {e}",
-            "traceback": traceback.format_exc()
-        }
+        return _error_response("Failed to add component", e, data)
 
 
-def get_blueprint_info(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Get information about a Blueprint"""
-    import unreal
+def _add_subobject(sds, params, comp_class, parent_handle):
+    """Add one subobject through a Blueprint-bound params object.
+
+    Returns (new_handle, fail_reason); fail_reason is empty on success.
+    """
+    params.set_editor_property('new_class', comp_class)
+    # A reused params object must not keep the previous add's parent
+    params.set_editor_property('parent_handle', parent_handle or unreal.SubobjectDataHandle())
+
+    new_handle, fail_reason = sds.add_new_subobject(params)
 
-    blueprint_path = data.get("blueprint_path", "") or data.get("path", "")
+    # fail_reason is Text type - check if it has content
+    fail_str = str(fail_reason).strip() if fail_reason else ""
+    return new_handle, fail_str
 
-    if not blueprint_path:
-        return {"success": False, "error": "blueprint_path is required"}
 
-    # Normalize path
-    if not blueprint_path.startswith("/Game"):
-        blueprint_path = f"/Game/{blueprint_path}"
+def _name_new_subobject(sds, handle, name: str):
+    """Rename a newly added subobject to the requested name.
+
+    Returns (subobject_data, display name); the display name is the engine
+    default if the rename was refused (e.g. the name is already taken).
+    """
+    try:
+        sds.rename_subobject(handle, unreal.Text(name))
+    except Exception:
+        pass
+    sd = sds.k2_find_subobject_data_from_handle(handle)
+    if not sd:
+        return None, name
+    return sd, str(unreal.SubobjectDataBlueprintFunctionLibrary.get_display_name(sd))
+
+
+def _apply_add_component(blueprint, blueprint_path: str, sds, index, data: Dict[str, Any],
+                         params=None) -> Dict[str, Any]:
+    """Add a component to a loaded Blueprint without compiling or saving.
+
+    Batches pass one AddNewSubobjectParams, already bound to the Blueprint,
+    and it is updated in place for each add. The new component is renamed to
+    the requested name and added to `index` so later edits can find it.
+    """
+    component_type = data.get("component_class", "") or data.get("component_type", "StaticMeshComponent")
+    component_name = data.get("component_name", "") or data.get("name", "NewComponent")
+    parent_component = data.get("parent", None)
+
+    # Get component class
+    comp_class = _get_component_static_class(component_type)
+
+    if not comp_class:
+        return {"success": False, "error": f"Component class not found: {component_type}"}
+
+    # Find root handle among existing subobjects
+    root_handle = next((entry[0] for entry in index.values() if entry[2]), None)
+
+    # Find parent handle if specified
+    parent_handle = root_handle  # Default to root
+    if parent_component:
+        parent_entry = index.get(parent_component)
+        if parent_entry:
+            parent_handle = parent_entry[0]
+
+    # Create params for adding new subobject
+    if params is None:
+        params = unreal.AddNewSubobjectParams()
+        params.set_editor_property('blueprint_context', blueprint)
+
+    new_handle, fail_str = _add_subobject(sds, params, comp_class, parent_handle)
+    if fail_str:
+        return {"success": False, "error": f"Failed to add component: {fail_str}"}
+
+    sd, component_name = _name_new_subobject(sds, new_handle, component_name)
+    if sd:
+        entry = (new_handle, sd, False, True, unreal.SubobjectDataBlueprintFunctionLibrary.get_object(sd))
+        index.setdefault(component_name, entry)
+
+    return {
+        "success": True,
+        "blueprint": blueprint_path,
+        "component": component_name,
+        "component_type": component_type,
+        "parent": parent_component,
+        "message": f"Added {component_type} '{component_name}' to blueprint"
+    }
+
+
+def get_blueprint_info(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Get information about a Blueprint"""
+    blueprint_path, error = _ensure_bp_path(data)
+    if error:
+        return error
 
     try:
         # Load the Blueprint
-        blueprint = unreal.load_asset(blueprint_path)
+        blueprint = _load_blueprint(blueprint_path)
         if not blueprint:
             return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
 
@@ -285,22 +459,33 @@ def get_blueprint_info(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": f"Failed to get Blueprint info: {e}"}
 
 
-def compile_blueprint(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Compile a Blueprint"""
-    import unreal
+def get_blueprint_info_many(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Get information about several Blueprints in one game-thread visit"""
+    paths = data.get("blueprint_paths") or data.get("paths") or []
 
-    blueprint_path = data.get("blueprint_path", "") or data.get("path", "")
+    if not paths:
+        return {"success": False, "error": "blueprint_paths is required"}
 
-    if not blueprint_path:
-        return {"success": False, "error": "blueprint_path is required"}
+    results = [get_blueprint_info({"blueprint_path": path}) for path in paths]
+    found = sum(1 for r in results if r.get("success"))
 
-    # Normalize path
-    if not blueprint_path.startswith("/Game"):
-        blueprint_path = f"/Game/{blueprint_path}"
+    return {
+        "success": True,
+        "count": len(results),
+        "found": found,
+        "blueprints": results,
+    }
+
+
+def compile_blueprint(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Compile a Blueprint"""
+    blueprint_path, error = _ensure_bp_path(data)
+    if error:
+        return error
 
     try:
         # Load the Blueprint
-        blueprint = unreal.load_asset(blueprint_path)
+        blueprint = _load_blueprint(blueprint_path)
         if not blueprint:
             return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
 
@@ -308,7 +493,8 @@ def compile_blueprint(data: Dict[str, Any]) -> Dict[str, Any]:
         unreal.BlueprintEditorLibrary.compile_blueprint(blueprint)
 
         # Save
-        unreal.EditorAssetLibrary.save_asset(blueprint_path)
+        unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
+        _invalidate_blueprint(blueprint_path)
 
         return {
             "success": True,
@@ -322,25 +508,18 @@ def compile_blueprint(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def open_blueprint_editor(data: Dict[str, Any]) -> Dict[str, Any]:
     """Open a Blueprint in the editor"""
-    import unreal
-
-    blueprint_path = data.get("blueprint_path", "") or data.get("path", "")
-
-    if not blueprint_path:
-        return {"success": False, "error": "blueprint_path is required"}
-
-    # Normalize path
-    if not blueprint_path.startswith("/Game"):
-        blueprint_path = f"/Game/{blueprint_path}"
+    blueprint_path, error = _ensure_bp_path(data)
+    if error:
+        return error
 
     try:
         # Load the Blueprint
-        blueprint = unreal.load_asset(blueprint_path)
+        blueprint = _load_blueprint(blueprint_path)
         if not blueprint:
             return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
 
         # Open in editor
-        unreal.AssetEditorSubsystem().open_editor_for_assets([blueprint])
+        _asset_editor().open_editor_for_assets([blueprint])
 
         return {
             "success": True,
@@ -354,8 +533,6 @@ def open_blueprint_editor(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def create_blueprint_from_actor(data: Dict[str, Any]) -> Dict[str, Any]:
     """Create a Blueprint from an existing actor"""
-    import unreal
-
     actor_name = data.get("actor_name", "")
     blueprint_name = data.get("blueprint_name", "")
     blueprint_path = data.get("path", "/Game/Blueprints")
@@ -368,13 +545,7 @@ def create_blueprint_from_actor(data: Dict[str, Any]) -> Dict[str, Any]:
 
     try:
         # Find the actor
-        actors = unreal.EditorLevelLibrary.get_all_level_actors()
-        target_actor = None
-
-        for actor in actors:
-            if actor.get_actor_label() == actor_name:
-                target_actor = actor
-                break
+        target_actor = find_actor_by_label(actor_name)
 
         if not target_actor:
             return {"success": False, "error": f"Actor not found: {actor_name}"}
@@ -398,226 +569,349 @@ def create_blueprint_from_actor(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def set_component_property(data: Dict[str, Any]) -> Dict[str, Any]:
     """Set a property on a blueprint component using UE5 SubobjectDataSubsystem"""
-    import unreal
+    blueprint_path, error = _ensure_bp_path(data)
+    if error:
+        return error
+
+    try:
+        blueprint = _load_blueprint(blueprint_path)
+        if not blueprint:
+            return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
+
+        # Get SubobjectDataSubsystem
+        sds = _sds()
+        if not sds:
+            return {"success": False, "error": "Failed to get SubobjectDataSubsystem"}
+
+        index = _get_handle_index(sds, blueprint, blueprint_path)
+        result = _apply_component_property(blueprint, blueprint_path, sds, index, data)
+        if result["success"]:
+            unreal.BlueprintEditorLibrary.compile_blueprint(blueprint)
+            unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
+            _invalidate_blueprint(blueprint_path)
+        return result
+
+    except Exception as e:
+        return _error_response("Failed to set property", e, data)
+
 
-    blueprint_path = data.get("blueprint_path", "")
+def _apply_component_property(blueprint, blueprint_path: str, sds, index, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Set a component template property without compiling or saving"""
     component_name = data.get("component_name", "")
     property_name = data.get("property", "") or data.get("property_name", "")
     value = data.get("value")
 
-    if not blueprint_path:
-        return {"success": False, "error": "blueprint_path is required"}
     if not component_name:
         return {"success": False, "error": "component_name is required"}
     if not property_name:
         return {"success": False, "error": "property is required"}
 
-    # Normalize path
-    if not blueprint_path.startswith("/Game"):
-        blueprint_path = f"/Game/{blueprint_path}"
+    # Find the component
+    entry = index.get(component_name)
+    if not entry:
+        return {"success": False, "error": f"Component not found: {component_name}"}
+
+    template = entry[4]
+    if template and _has_property(template, property_name):
+        template.set_editor_property(property_name, value)
+        return {
+            "success": True,
+            "blueprint": blueprint_path,
+            "component": component_name,
+            "property": property_name,
+            "value": str(value),
+            "message": f"Set {property_name} on {component_name}"
+        }
+    else:
+        return {"success": False, "error": f"Property '{property_name}' not found on component"}
+
+
+def set_component_transform(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Set transform (location/rotation/scale) on a blueprint component using UE5 SubobjectDataSubsystem"""
+    blueprint_path, error = _ensure_bp_path(data)
+    if error:
+        return error
 
     try:
-        blueprint = unreal.load_asset(blueprint_path)
+        blueprint = _load_blueprint(blueprint_path)
         if not blueprint:
             return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
 
         # Get SubobjectDataSubsystem
-        sds = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+        sds = _sds()
         if not sds:
             return {"success": False, "error": "Failed to get SubobjectDataSubsystem"}
 
-        sdbfl = unreal.SubobjectDataBlueprintFunctionLibrary
-        handles = sds.k2_gather_subobject_data_for_blueprint(blueprint)
-
-        # Find the component
-        for h in handles:
-            sd = sds.k2_find_subobject_data_from_handle(h)
-            if sd:
-                name = str(sdbfl.get_display_name(sd))  # Convert Text to string
-                if name == component_name:
-                    template = sdbfl.get_object(sd)
-                    if template and hasattr(template, property_name):
-                        template.set_editor_property(property_name, value)
-                        unreal.BlueprintEditorLibrary.compile_blueprint(blueprint)
-                        unreal.EditorAssetLibrary.save_asset(blueprint_path)
-                        return {
-                            "success": True,
-                            "blueprint": blueprint_path,
-                            "component": component_name,
-                            "property": property_name,
-                            "value": str(value),
-                            "message": f"Set {property_name} on {component_name}"
-                        }
-                    else:
-                        return {"success": False, "error": f"Property '{property_name}' not found on component"}
-
-        return {"success": False, "error": f"Component not found: {component_name}"}
+        index = _get_handle_index(sds, blueprint, blueprint_path)
+        result = _apply_component_transform(blueprint, blueprint_path, sds, index, data)
+        if result["success"]:
+            unreal.BlueprintEditorLibrary.compile_blueprint(blueprint)
+            unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
+            _invalidate_blueprint(blueprint_path)
+        return result
 
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Failed to set property: {e}",
-            "traceback": traceback.format_exc()
-        }
+        return _error_response("Failed to set transform", e, data)
 
 
-def set_component_transform(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Set transform (location/rotation/scale) on a blueprint component using UE5 SubobjectDataSubsystem"""
-    import unreal
+def _validate_transform(location, rotation, scale) -> Optional[Dict[str, Any]]:
+    """Error response if a location/rotation/scale value is not a 3-element array"""
+    if location and (not isinstance(location, (list, tuple)) or len(location) != 3):
+        return {"success": False, "error": "location must be an array of 3 values [x, y, z]"}
+    if rotation and (not isinstance(rotation, (list, tuple)) or len(rotation) != 3):
+        return {"success": False, "error": "rotation must be an array of 3 values [pitch, yaw, roll]"}
+    if scale and (not isinstance(scale, (list, tuple)) or len(scale) != 3):
+        return {"success": False, "error": "scale must be an array of 3 values [x, y, z]"}
+    return None
+
+
+def _set_template_transform(template, location, rotation, scale) -> List[str]:
+    """Apply validated transform values to a component template; returns the changes made"""
+    changes = []
+    props = {}
+
+    # Set location
+    if location and _has_property(template, 'relative_location'):
+        props['relative_location'] = unreal.Vector(float(location[0]), float(location[1]), float(location[2]))
+        changes.append(f"location={location}")
+
+    # Set rotation
+    if rotation and _has_property(template, 'relative_rotation'):
+        props['relative_rotation'] = unreal.Rotator(float(rotation[0]), float(rotation[1]), float(rotation[2]))
+        changes.append(f"rotation={rotation}")
+
+    # Set scale
+    if scale and _has_property(template, 'relative_scale3d'):
+        props['relative_scale3d'] = unreal.Vector(float(scale[0]), float(scale[1]), float(scale[2]))
+        changes.append(f"scale={scale}")
 
-    blueprint_path = data.get("blueprint_path", "")
+    # One call so the change notification (and construction script rerun) fires once
+    if props:
+        template.set_editor_properties(props)
+
+    return changes
+
+
+def _apply_component_transform(blueprint, blueprint_path: str, sds, index, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Set a component template transform without compiling or saving"""
     component_name = data.get("component_name", "")
     location = data.get("location")  # [x, y, z]
     rotation = data.get("rotation")  # [pitch, yaw, roll]
     scale = data.get("scale")  # [x, y, z]
 
-    if not blueprint_path:
-        return {"success": False, "error": "blueprint_path is required"}
     if not component_name:
         return {"success": False, "error": "component_name is required"}
 
-    # Validate array lengths
-    if location and (not isinstance(location, (list, tuple)) or len(location) != 3):
-        return {"success": False, "error": "location must be an array of 3 values [x, y, z]"}
-    if rotation and (not isinstance(rotation, (list, tuple)) or len(rotation) != 3):
-        return {"success": False, "error": "rotation must be an array of 3 values [pitch, yaw, roll]"}
-    if scale and (not isinstance(scale, (list, tuple)) or len(scale) != 3):
-        return {"success": False, "error": "scale must be an array of 3 values [x, y, z]"}
+    error = _validate_transform(location, rotation, scale)
+    if error:
+        return error
+
+    # Find the component
+    entry = index.get(component_name)
+    if not entry:
+        return {"success": False, "error": f"Component not found: {component_name}"}
+
+    template = entry[4]
+    if not template:
+        return {"success": False, "error": f"Could not get template for component: {component_name}"}
 
-    # Normalize path
-    if not blueprint_path.startswith("/Game"):
-        blueprint_path = f"/Game/{blueprint_path}"
+    changes = _set_template_transform(template, location, rotation, scale)
+
+    if changes:
+        return {
+            "success": True,
+            "blueprint": blueprint_path,
+            "component": component_name,
+            "changes": changes,
+            "message": f"Transform updated: {', '.join(changes)}"
+        }
+    else:
+        return {"success": False, "error": "No transform values provided"}
+
+
+def batch_blueprint_edit(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply several component edits to one Blueprint with a single compile/save"""
+    blueprint_path, error = _ensure_bp_path(data)
+    if error:
+        return error
+
+    ops = data.get("ops", [])
+    if not ops:
+        return {"success": False, "error": "ops list is required"}
 
     try:
-        blueprint = unreal.load_asset(blueprint_path)
+        blueprint = _load_blueprint(blueprint_path)
         if not blueprint:
             return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
 
-        # Get SubobjectDataSubsystem
-        sds = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+        if not isinstance(blueprint, unreal.Blueprint):
+            return {"success": False, "error": f"Asset is not a Blueprint: {blueprint_path}"}
+
+        sds = _sds()
         if not sds:
             return {"success": False, "error": "Failed to get SubobjectDataSubsystem"}
 
-        sdbfl = unreal.SubobjectDataBlueprintFunctionLibrary
-        handles = sds.k2_gather_subobject_data_for_blueprint(blueprint)
-
-        # Find the component
-        for h in handles:
-            sd = sds.k2_find_subobject_data_from_handle(h)
-            if sd:
-                name = str(sdbfl.get_display_name(sd))  # Convert Text to string
-                if name == component_name:
-                    template = sdbfl.get_object(sd)
-                    if not template:
-                        return {"success": False, "error": f"Could not get template for component: {component_name}"}
-
-                    changes = []
-
-                    # Set location
-                    if location and hasattr(template, 'relative_location'):
-                        loc = unreal.Vector(float(location[0]), float(location[1]), float(location[2]))
-                        template.set_editor_property('relative_location', loc)
-                        changes.append(f"location={location}")
-
-                    # Set rotation
-                    if rotation and hasattr(template, 'relative_rotation'):
-                        rot = unreal.Rotator(float(rotation[0]), float(rotation[1]), float(rotation[2]))
-                        template.set_editor_property('relative_rotation', rot)
-                        changes.append(f"rotation={rotation}")
-
-                    # Set scale
-                    if scale and hasattr(template, 'relative_scale3d'):
-                        sc = unreal.Vector(float(scale[0]), float(scale[1]), float(scale[2]))
-                        template.set_editor_property('relative_scale3d', sc)
-                        changes.append(f"scale={scale}")
-
-                    if changes:
-                        unreal.BlueprintEditorLibrary.compile_blueprint(blueprint)
-                        unreal.EditorAssetLibrary.save_asset(blueprint_path)
-                        return {
-                            "success": True,
-                            "blueprint": blueprint_path,
-                            "component": component_name,
-                            "changes": changes,
-                            "message": f"Transform updated: {', '.join(changes)}"
-                        }
-                    else:
-                        return {"success": False, "error": "No transform values provided"}
-
-        return {"success": False, "error": f"Component not found: {component_name}"}
+        # Copied so components added below do not leak into the cached index
+        index = dict(_get_handle_index(sds, blueprint, blueprint_path))
+        results = []
+        add_params = None
+
+        for op in ops:
+            apply = _BATCH_OPS.get(op.get("type", ""))
+            if not apply:
+                results.append({"success": False, "error": f"Unknown batch op: {op.get('type', '')}"})
+                continue
+
+            if apply is _apply_add_component:
+                if add_params is None:
+                    add_params = unreal.AddNewSubobjectParams()
+                    add_params.set_editor_property('blueprint_context', blueprint)
+                result = apply(blueprint, blueprint_path, sds, index, op, add_params)
+            else:
+                result = apply(blueprint, blueprint_path, sds, index, op)
+            results.append(result)
+
+        applied = sum(1 for r in results if r["success"])
+        if applied:
+            # One compile/save for the whole batch
+            unreal.BlueprintEditorLibrary.compile_blueprint(blueprint)
+            unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
+            _invalidate_blueprint(blueprint_path)
+
+            if data.get("open_editor", False):
+                _asset_editor().open_editor_for_assets([blueprint])
 
-    except Exception as e:
         return {
-            "success": False,
-            "error": f"Failed to set transform: {e}",
-            "traceback": traceback.format_exc()
+            "success": applied == len(results),
+            "blueprint": blueprint_path,
+            "results": results,
+            "applied": applied,
+            "count": len(results)
         }
 
+    except Exception as e:
+        return _error_response("Batch edit failed", e, data)
 
-def get_blueprint_components(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Get list of components in a blueprint using UE5 SubobjectDataSubsystem"""
-    import unreal
 
-    blueprint_path = data.get("blueprint_path", "") or data.get("path", "")
+# Sub-operations accepted by batch_blueprint_edit
+_BATCH_OPS = {
+    "add_component": _apply_add_component,
+    "add_blueprint_component": _apply_add_component,
+    "set_property": _apply_component_property,
+    "set_component_property": _apply_component_property,
+    "set_transform": _apply_component_transform,
+    "set_component_transform": _apply_component_transform,
+}
+
 
-    if not blueprint_path:
-        return {"success": False, "error": "blueprint_path is required"}
+def add_blueprint_components_bulk(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Add many components to one Blueprint with a single gather, compile and save"""
+    blueprint_path, error = _ensure_bp_path(data)
+    if error:
+        return error
 
-    # Normalize path
-    if not blueprint_path.startswith("/Game"):
-        blueprint_path = f"/Game/{blueprint_path}"
+    components = data.get("components", [])
+    if not components:
+        return {"success": False, "error": "components list is required"}
 
     try:
-        blueprint = unreal.load_asset(blueprint_path)
+        blueprint = _load_blueprint(blueprint_path)
         if not blueprint:
             return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
 
-        # Get SubobjectDataSubsystem
-        sds = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+        if not isinstance(blueprint, unreal.Blueprint):
+            return {"success": False, "error": f"Asset is not a Blueprint: {blueprint_path}"}
+
+        sds = _sds()
         if not sds:
             return {"success": False, "error": "Failed to get SubobjectDataSubsystem"}
 
-        sdbfl = unreal.SubobjectDataBlueprintFunctionLibrary
-        handles = sds.k2_gather_subobject_data_for_blueprint(blueprint)
+        # Gather once; components added below are renamed to their requested
+        # names and tracked so later entries can use them as parents
+        index = _get_handle_index(sds, blueprint, blueprint_path)
+        root_handle = next((entry[0] for entry in index.values() if entry[2]), None)
+        handles = {name: entry[0] for name, entry in index.items()}
 
-        components = []
-        seen_names = set()  # Track unique components
+        sdbfl = unreal.SubobjectDataBlueprintFunctionLibrary
+        params = unreal.AddNewSubobjectParams()
+        params.set_editor_property('blueprint_context', blueprint)
+        results = []
+
+        for spec in components:
+            component_type = spec.get("type", "") or spec.get("component_type", "StaticMeshComponent")
+            component_name = spec.get("name", "") or spec.get("component_name", "NewComponent")
+            parent_component = spec.get("parent", None)
+            transform = spec.get("transform") or {}
+            location = transform.get("location")
+            rotation = transform.get("rotation")
+            scale = transform.get("scale")
+
+            comp_class = _get_component_static_class(component_type)
+            if not comp_class:
+                results.append({"success": False, "error": f"Component class not found: {component_type}"})
+                continue
+
+            error = _validate_transform(location, rotation, scale)
+            if error:
+                results.append(error)
+                continue
+
+            parent_handle = handles.get(parent_component, root_handle) if parent_component else root_handle
+            new_handle, fail_str = _add_subobject(sds, params, comp_class, parent_handle)
+            if fail_str:
+                results.append({"success": False, "error": f"Failed to add component: {fail_str}"})
+                continue
+            sd, component_name = _name_new_subobject(sds, new_handle, component_name)
+            handles.setdefault(component_name, new_handle)
+
+            result = {
+                "success": True,
+                "component": component_name,
+                "component_type": component_type,
+                "parent": parent_component
+            }
+            if sd and (location or rotation or scale):
+                template = sdbfl.get_object(sd)
+                if template:
+                    result["changes"] = _set_template_transform(template, location, rotation, scale)
+            results.append(result)
 
-        for h in handles:
-            sd = sds.k2_find_subobject_data_from_handle(h)
-            if sd:
-                name = str(sdbfl.get_display_name(sd))  # Convert Text to string for hashing
+        added = sum(1 for r in results if r["success"])
+        if added:
+            # One compile/save for all components
+            unreal.BlueprintEditorLibrary.compile_blueprint(blueprint)
+            unreal.EditorAssetLibrary.save_loaded_asset(blueprint)
+            _invalidate_blueprint(blueprint_path)
 
-                # Skip duplicates and the root actor object
-                if name in seen_names:
-                    continue
-                seen_names.add(name)
+        return {
+            "success": added == len(results),
+            "blueprint": blueprint_path,
+            "results": results,
+            "added": added,
+            "count": len(results)
+        }
 
-                is_component = sdbfl.is_component(sd)
-                is_root = sdbfl.is_root_component(sd)
+    except Exception as e:
+        return _error_response("Bulk add failed", e, data)
 
-                # Skip non-component entries (like the actor itself)
-                if not is_component:
-                    continue
 
-                template = sdbfl.get_object(sd)
-                comp_type = template.get_class().get_name() if template else "Unknown"
+def get_blueprint_components(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Get list of components in a blueprint using UE5 SubobjectDataSubsystem"""
+    blueprint_path, error = _ensure_bp_path(data)
+    if error:
+        return error
 
-                comp_info = {
-                    "name": name,
-                    "type": comp_type,
-                    "is_root": is_root
-                }
+    try:
+        blueprint = _load_blueprint(blueprint_path)
+        if not blueprint:
+            return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
 
-                # Get transform if available
-                if template and hasattr(template, 'relative_location'):
-                    try:
-                        loc = template.get_editor_property('relative_location')
-                        comp_info["location"] = {"x": loc.x, "y": loc.y, "z": loc.z}
-                    except (AttributeError, RuntimeError):
-                        pass
+        # Get SubobjectDataSubsystem
+        sds = _sds()
+        if not sds:
+            return {"success": False, "error": "Failed to get SubobjectDataSubsystem"}
 
-                components.append(comp_info)
+        components = _get_component_summaries(sds, blueprint, blueprint_path)
 
         return {
             "success": True,
@@ -627,8 +921,25 @@ def get_blueprint_components(data: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Failed to get components: {e}",
-            "traceback": traceback.format_exc()
-        }
+        return _error_response("Failed to get components", e, data)
+
+
+# Command dispatch table (built once, after all handlers are defined)
+_HANDLERS = {
+    "create_blueprint": create_blueprint,
+    "add_blueprint_component": add_blueprint_component,
+    "get_blueprint_info": get_blueprint_info,
+    "get_blueprint_info_many": get_blueprint_info_many,
+    "compile_blueprint": compile_blueprint,
+    "open_blueprint_editor": open_blueprint_editor,
+    "create_blueprint_from_actor": create_blueprint_from_actor,
+    "set_component_property": set_component_property,
+    "set_component_transform": set_component_transform,
+    "get_blueprint_components": get_blueprint_components,
+    "batch_blueprint_edit": batch_blueprint_edit,
+    "add_blueprint_components_bulk": add_blueprint_components_bulk,
+}
+_HANDLERS_GET = _HANDLERS.get
+
+# Handlers that create assets and therefore invalidate cached asset listings
+_CREATING_HANDLERS = frozenset({create_blueprint, create_blueprint_from_actor})
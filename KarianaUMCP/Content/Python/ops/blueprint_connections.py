@@ -11,61 +11,109 @@ Supports:
 - get_blueprint_graph_connections
 """
 
-from typing import Dict, Any, List, Optional
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+import threading
+import time
 import traceback
 
 
+# Per-request memo of _fetch_pins_internal results, keyed by
+# (blueprint_path, function_name, node_name). None outside _pin_cache_enabled().
+_pin_cache: Optional[Dict[Tuple[str, str, str], tuple]] = None
+
+
+@contextmanager
+def _pin_cache_enabled():
+    """Share pin lookups for the duration of one request; nested uses join the outer scope"""
+    global _pin_cache
+    owner = _pin_cache is None
+    if owner:
+        _pin_cache = {}
+    try:
+        yield
+    finally:
+        if owner:
+            _pin_cache = None
+
+
 def handle_blueprint_connection_command(data: Dict[str, Any]) -> Dict[str, Any]:
     """Route blueprint connection commands to appropriate handlers"""
-    cmd = data.get("type", "")
-
-    handlers = {
-        "get_blueprint_node_pins": get_blueprint_node_pins,
-        "validate_blueprint_connection": validate_blueprint_connection,
-        "auto_connect_blueprint_chain": auto_connect_blueprint_chain,
-        "suggest_blueprint_connections": suggest_blueprint_connections,
-        "get_blueprint_graph_connections": get_blueprint_graph_connections,
-    }
-
-    handler = handlers.get(cmd)
-    if handler:
-        try:
+    handler = _HANDLERS_GET(data.get("type", ""))
+    if handler is None:
+        return {"success": False, "error": f"Unknown blueprint connection command: {data.get('type', '')}"}
+    try:
+        # Chains and suggestions look up the same node more than once
+        with _pin_cache_enabled():
             return handler(data)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }
-    else:
-        return {"success": False, "error": f"Unknown blueprint connection command: {cmd}"}
+    except Exception as e:
+        response = {"success": False, "error": str(e)}
+        # Formatting a traceback is costly; only do it when asked
+        if data.get("include_traceback", False):
+            response["traceback"] = traceback.format_exc()
+        return response
 
 
-def _load_blueprint(blueprint_path: str):
-    """Helper to load a blueprint"""
-    import unreal
+# Loaded Blueprints and the graphs resolved from them, keyed by normalized
+# asset path. Graph edits do not replace the Blueprint or graph objects, so
+# the TTL only bounds how long a deleted or reloaded asset can be served.
+BLUEPRINT_CACHE_TTL = 5.0
+_blueprint_cache: Dict[str, list] = {}  # path -> [expires_at, blueprint, {function_name: graph}]
+_blueprint_cache_lock = threading.Lock()
+
+
+def clear_blueprint_caches():
+    """Drop cached Blueprints, graphs and node indexes (e.g. after a reload)"""
+    with _blueprint_cache_lock:
+        _blueprint_cache.clear()
+    with _node_index_lock:
+        _node_index_cache.clear()
+
 
+def _normalize_path(blueprint_path: str) -> str:
+    """Root a Blueprint path under /Game"""
     if not blueprint_path.startswith("/Game"):
         blueprint_path = f"/Game/{blueprint_path}"
+    return blueprint_path
 
-    return unreal.load_asset(blueprint_path)
+
+def _load_blueprint(blueprint_path: str):
+    """Helper to load a blueprint, reusing a recently loaded instance"""
+    import unreal
+
+    blueprint_path = _normalize_path(blueprint_path)
+    now = time.monotonic()
+    with _blueprint_cache_lock:
+        entry = _blueprint_cache.get(blueprint_path)
+        if entry and entry[0] > now:
+            return entry[1]
+
+    blueprint = unreal.load_asset(blueprint_path)
+    if blueprint:
+        with _blueprint_cache_lock:
+            _blueprint_cache[blueprint_path] = [now + BLUEPRINT_CACHE_TTL, blueprint, {}]
+    return blueprint
 
 
 def _get_blueprint_graph(blueprint, function_name: str = "EventGraph"):
-    """Helper to get a blueprint graph"""
-    import unreal
+    """Helper to get a blueprint graph.
 
+    An exact name in either ubergraph_pages or function_graphs wins over a
+    graph whose name merely contains function_name.
+    """
     # Get all graphs from the blueprint
     try:
-        graphs = blueprint.get_editor_property("ubergraph_pages")
-        for graph in graphs:
-            if graph.get_name() == function_name or function_name in str(graph.get_name()):
-                return graph
+        graphs = list(blueprint.get_editor_property("ubergraph_pages"))
+        graphs.extend(blueprint.get_editor_property("function_graphs"))
+        names = [str(graph.get_name()) for graph in graphs]
 
-        # If not found in ubergraph_pages, check function_graphs
-        func_graphs = blueprint.get_editor_property("function_graphs")
-        for graph in func_graphs:
-            if graph.get_name() == function_name or function_name in str(graph.get_name()):
+        for name, graph in zip(names, graphs):
+            if name == function_name:
+                return graph
+        for name, graph in zip(names, graphs):
+            if function_name in name:
                 return graph
 
     except Exception:
@@ -74,6 +122,187 @@ def _get_blueprint_graph(blueprint, function_name: str = "EventGraph"):
     return None
 
 
+# {node_name: node} per graph, keyed by (blueprint_path, function_name).
+# A lookup that misses a cached index rebuilds it once, so nodes added in the
+# editor are found immediately; the TTL bounds how long removed nodes linger.
+NODE_INDEX_TTL = 2.0
+_node_index_cache: Dict[Tuple[str, str], list] = {}  # key -> [expires_at, graph, index]
+_node_index_lock = threading.Lock()
+
+
+def _graph_node_index(graph) -> Dict[str, Any]:
+    """Snapshot a graph's nodes by name, in graph order"""
+    return {node.get_name(): node for node in graph.get_editor_property("nodes")}
+
+
+def _match_node(index: Dict[str, Any], node_name: str):
+    """Exact name first, then the first node whose name ends with node_name"""
+    node = index.get(node_name)
+    if node is None:
+        node = next((n for name, n in index.items() if name.endswith(node_name)), None)
+    return node
+
+
+def _find_graph_node(graph, blueprint_path: str, function_name: str, node_name: str):
+    """Find a node in a graph through the cached name index"""
+    key = (blueprint_path, function_name)
+    now = time.monotonic()
+    with _node_index_lock:
+        entry = _node_index_cache.get(key)
+    if entry and entry[1] is graph and entry[0] > now:
+        node = _match_node(entry[2], node_name)
+        if node is not None:
+            return node
+
+    return _match_node(_refresh_node_index(graph, blueprint_path, function_name), node_name)
+
+
+def _refresh_node_index(graph, blueprint_path: str, function_name: str) -> Dict[str, Any]:
+    """Rebuild a graph's name index and store it in the cache"""
+    index = _graph_node_index(graph)
+    with _node_index_lock:
+        _node_index_cache[(blueprint_path, function_name)] = [time.monotonic() + NODE_INDEX_TTL, graph, index]
+    return index
+
+
+# Pin kinds, classified once per pin from its type string
+_PIN_EXEC = 0
+_PIN_OBJECT = 1
+_PIN_DATA = 2
+
+
+def _classify_pin_type(pin_type: str) -> int:
+    """Classify a pin type string as exec, object or other data"""
+    lowered = pin_type.lower()
+    if "exec" in lowered:
+        return _PIN_EXEC
+    if "object" in lowered:
+        return _PIN_OBJECT
+    return _PIN_DATA
+
+
+def _snapshot_pins(node):
+    """Read every pin of a node in one pass.
+
+    Returns parallel sequences (names, types, is_output, connected, kinds);
+    callers build per-pin dicts with _pin_info only for the pins they report.
+    """
+    names = []
+    types = []
+    is_output = array('b')
+    connected = array('b')
+    kinds = array('b')
+    for pin in node.get_editor_property("pins"):
+        # Each property is read once per pin; linked_to only feeds a truth test
+        get = pin.get_editor_property
+        pin_type = str(get("pin_type"))
+        names.append(pin.get_name())
+        types.append(pin_type)
+        is_output.append(get("direction") != 0)
+        connected.append(bool(get("linked_to")))
+        kinds.append(_classify_pin_type(pin_type))
+    return names, types, is_output, connected, kinds
+
+
+def _output_links(node):
+    """Yield (pin name, linked pins) for the connected output pins of a node.
+
+    Input pins cost only their direction read; linked_to is read once per output.
+    """
+    for pin in node.get_editor_property("pins"):
+        get = pin.get_editor_property
+        if get("direction") == 0:
+            continue
+        linked = get("linked_to")
+        if linked:
+            yield pin.get_name(), linked
+
+
+@dataclass
+class PinInfo:
+    """One pin of a node; handlers serialize it with as_dict only in responses"""
+    __slots__ = ("name", "type", "direction", "is_connected", "kind")
+    name: str
+    type: str
+    direction: str
+    is_connected: bool
+    kind: int  # _PIN_EXEC, _PIN_OBJECT or _PIN_DATA
+
+    @property
+    def is_exec(self) -> bool:
+        return self.kind == _PIN_EXEC
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "direction": self.direction,
+            "is_connected": self.is_connected,
+            "is_exec": self.is_exec
+        }
+
+
+def _pin_info(snapshot, i: int) -> PinInfo:
+    """Description of pin i of a snapshot"""
+    names, types, is_output, connected, kinds = snapshot
+    return PinInfo(
+        names[i],
+        types[i],
+        "output" if is_output[i] else "input",
+        bool(connected[i]),
+        kinds[i]
+    )
+
+
+def _resolve_graph(blueprint_path: str, function_name: str):
+    """Load a Blueprint and find one of its graphs; returns (graph, error response)"""
+    blueprint = _load_blueprint(blueprint_path)
+    if not blueprint:
+        return None, {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
+
+    with _blueprint_cache_lock:
+        entry = _blueprint_cache.get(_normalize_path(blueprint_path))
+        graphs = entry[2] if entry and entry[1] is blueprint else None
+        graph = graphs.get(function_name) if graphs is not None else None
+
+    if graph is None:
+        graph = _get_blueprint_graph(blueprint, function_name)
+        if not graph:
+            return None, {"success": False, "error": f"Function graph not found: {function_name}"}
+        if graphs is not None:
+            with _blueprint_cache_lock:
+                graphs[function_name] = graph
+
+    return graph, None
+
+
+def _fetch_pins_internal(graph, blueprint_path: str, function_name: str, node_name: str,
+                         refresh: bool = False):
+    """Pins of one node in an already resolved graph.
+
+    Returns (input_pins, output_pins, node_class), or None when the node is
+    not in the graph. Results are shared within a request (see _pin_cache).
+    """
+    cache = _pin_cache if not refresh else None
+    key = (blueprint_path, function_name, node_name)
+    if cache is not None and key in cache:
+        return cache[key]
+
+    target_node = _find_graph_node(graph, blueprint_path, function_name, node_name)
+    if not target_node:
+        return None
+
+    snapshot = _snapshot_pins(target_node)
+    is_output = snapshot[2]
+    input_pins = [_pin_info(snapshot, i) for i in range(len(is_output)) if not is_output[i]]
+    output_pins = [_pin_info(snapshot, i) for i in range(len(is_output)) if is_output[i]]
+
+    result = (input_pins, output_pins, target_node.get_class().get_name())
+    if cache is not None:
+        cache[key] = result
+    return result
+
+
 def get_blueprint_node_pins(data: Dict[str, Any]) -> Dict[str, Any]:
     """Get all pins for a Blueprint node.
 
@@ -94,56 +323,22 @@ def get_blueprint_node_pins(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": "node_name is required"}
 
     try:
-        blueprint = _load_blueprint(blueprint_path)
-        if not blueprint:
-            return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
+        graph, error = _resolve_graph(blueprint_path, function_name)
+        if error:
+            return error
 
-        graph = _get_blueprint_graph(blueprint, function_name)
-        if not graph:
-            return {"success": False, "error": f"Function graph not found: {function_name}"}
-
-        # Get nodes from graph
-        nodes = graph.get_editor_property("nodes")
-        target_node = None
-
-        for node in nodes:
-            if node.get_name() == node_name or str(node.get_name()).endswith(node_name):
-                target_node = node
-                break
-
-        if not target_node:
+        pins = _fetch_pins_internal(graph, blueprint_path, function_name, node_name,
+                                    refresh=data.get("refresh", False))
+        if pins is None:
             return {"success": False, "error": f"Node not found: {node_name}"}
 
-        # Get pins from node
-        input_pins = []
-        output_pins = []
-
-        try:
-            # Get all pins
-            all_pins = target_node.get_editor_property("pins")
-
-            for pin in all_pins:
-                pin_info = {
-                    "name": pin.get_name(),
-                    "type": str(pin.get_editor_property("pin_type")),
-                    "direction": "input" if pin.get_editor_property("direction") == 0 else "output",
-                    "is_connected": len(pin.get_editor_property("linked_to")) > 0
-                }
-
-                if pin_info["direction"] == "input":
-                    input_pins.append(pin_info)
-                else:
-                    output_pins.append(pin_info)
-
-        except Exception as e:
-            return {"success": False, "error": f"Failed to get pins: {e}"}
-
+        input_pins, output_pins, node_class = pins
         return {
             "success": True,
             "node_name": node_name,
-            "node_class": target_node.get_class().get_name(),
-            "input_pins": input_pins,
-            "output_pins": output_pins,
+            "node_class": node_class,
+            "input_pins": [pin.as_dict() for pin in input_pins],
+            "output_pins": [pin.as_dict() for pin in output_pins],
             "total_pins": len(input_pins) + len(output_pins)
         }
 
@@ -160,6 +355,7 @@ def validate_blueprint_connection(data: Dict[str, Any]) -> Dict[str, Any]:
         source_pin: Source pin name
         target_node: Target node name
         target_pin: Target pin name
+        verbose: List the available pins when a pin is not found (default True)
     """
     import unreal
 
@@ -172,35 +368,36 @@ def validate_blueprint_connection(data: Dict[str, Any]) -> Dict[str, Any]:
     if not all([blueprint_path, source_node, source_pin, target_node, target_pin]):
         return {"success": False, "error": "All parameters required: blueprint_path, source_node, source_pin, target_node, target_pin"}
 
+    function_name = data.get("function_name", "EventGraph") or "EventGraph"
+
     try:
-        # Get pin information for both nodes
-        source_result = get_blueprint_node_pins({
-            "blueprint_path": blueprint_path,
-            "node_name": source_node
-        })
+        # Resolve the graph once for both nodes
+        graph, error = _resolve_graph(blueprint_path, function_name)
+        if error:
+            return {"success": False, "error": f"Source node error: {error['error']}"}
 
-        if not source_result.get("success"):
-            return {"success": False, "error": f"Source node error: {source_result.get('error')}"}
+        source_result = _fetch_pins_internal(graph, blueprint_path, function_name, source_node)
+        if source_result is None:
+            return {"success": False, "error": f"Source node error: Node not found: {source_node}"}
 
-        target_result = get_blueprint_node_pins({
-            "blueprint_path": blueprint_path,
-            "node_name": target_node
-        })
+        target_result = _fetch_pins_internal(graph, blueprint_path, function_name, target_node)
+        if target_result is None:
+            return {"success": False, "error": f"Target node error: Node not found: {target_node}"}
 
-        if not target_result.get("success"):
-            return {"success": False, "error": f"Target node error: {target_result.get('error')}"}
+        source_outputs = source_result[1]
+        target_inputs = target_result[0]
 
         # Find source pin in outputs
         source_pin_info = None
-        for pin in source_result.get("output_pins", []):
-            if pin["name"] == source_pin or source_pin in pin["name"]:
+        for pin in source_outputs:
+            if pin.name == source_pin or source_pin in pin.name:
                 source_pin_info = pin
                 break
 
         # Find target pin in inputs
         target_pin_info = None
-        for pin in target_result.get("input_pins", []):
-            if pin["name"] == target_pin or target_pin in pin["name"]:
+        for pin in target_inputs:
+            if pin.name == target_pin or target_pin in pin.name:
                 target_pin_info = pin
                 break
 
@@ -210,7 +407,7 @@ def validate_blueprint_connection(data: Dict[str, Any]) -> Dict[str, Any]:
                 "valid": False,
                 "error_type": "PIN_NOT_FOUND",
                 "message": f"Source output pin not found: {source_pin}",
-                "available_output_pins": [p["name"] for p in source_result.get("output_pins", [])]
+                "available_output_pins": [p.name for p in source_outputs] if data.get("verbose", True) else []
             }
 
         if not target_pin_info:
@@ -219,18 +416,15 @@ def validate_blueprint_connection(data: Dict[str, Any]) -> Dict[str, Any]:
                 "valid": False,
                 "error_type": "PIN_NOT_FOUND",
                 "message": f"Target input pin not found: {target_pin}",
-                "available_input_pins": [p["name"] for p in target_result.get("input_pins", [])]
+                "available_input_pins": [p.name for p in target_inputs] if data.get("verbose", True) else []
             }
 
         # Basic type compatibility check
-        source_type = source_pin_info.get("type", "")
-        target_type = target_pin_info.get("type", "")
+        source_type = source_pin_info.type
+        target_type = target_pin_info.type
 
         # Simple validation - execution pins connect to execution, data to data
-        is_exec_source = "exec" in source_type.lower()
-        is_exec_target = "exec" in target_type.lower()
-
-        if is_exec_source != is_exec_target:
+        if source_pin_info.is_exec != target_pin_info.is_exec:
             return {
                 "success": True,
                 "valid": False,
@@ -243,8 +437,8 @@ def validate_blueprint_connection(data: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "success": True,
             "valid": True,
-            "source_pin": source_pin_info,
-            "target_pin": target_pin_info,
+            "source_pin": source_pin_info.as_dict(),
+            "target_pin": target_pin_info.as_dict(),
             "message": "Connection appears valid"
         }
 
@@ -271,76 +465,100 @@ def auto_connect_blueprint_chain(data: Dict[str, Any]) -> Dict[str, Any]:
     if len(node_chain) < 2:
         return {"success": False, "error": "node_chain must contain at least 2 nodes"}
 
+    function_name = data.get("function_name", "EventGraph") or "EventGraph"
+
     try:
-        blueprint = _load_blueprint(blueprint_path)
-        if not blueprint:
-            return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
+        # Resolve the graph once for the whole chain
+        graph, error = _resolve_graph(blueprint_path, function_name)
+        if error:
+            return error
 
         connections_made = []
         failed_connections = []
         warnings = []
 
+        # Check the whole chain against one fresh name index, so missing nodes
+        # are found without a lookup (and index rebuild) per pair
+        index = _refresh_node_index(graph, blueprint_path, function_name)
+        missing_nodes = []
+        for name in node_chain:
+            if name not in missing_nodes and _match_node(index, name) is None:
+                missing_nodes.append(name)
+
+        # Read every node's pins once, in chain order. Graph objects may only
+        # be touched on the game thread, so this stays a sequential pass
+        chain_pins = [None] * len(node_chain)
+        pin_errors = {}  # node name -> why its pins could not be read
+        for i, node_name in enumerate(node_chain):
+            if node_name in missing_nodes:
+                continue
+            try:
+                chain_pins[i] = _fetch_pins_internal(graph, blueprint_path, function_name, node_name)
+            except Exception as e:
+                pin_errors[node_name] = str(e)
+
         # Process pairs of nodes
         for i in range(len(node_chain) - 1):
             source_node = node_chain[i]
             target_node = node_chain[i + 1]
+            source_pins = chain_pins[i]
+            target_pins = chain_pins[i + 1]
 
-            # Get pins for both nodes
-            source_pins = get_blueprint_node_pins({
-                "blueprint_path": blueprint_path,
-                "node_name": source_node
-            })
-
-            target_pins = get_blueprint_node_pins({
-                "blueprint_path": blueprint_path,
-                "node_name": target_node
-            })
-
-            if not source_pins.get("success") or not target_pins.get("success"):
-                failed_connections.append({
+            if source_pins is None or target_pins is None:
+                failure = {
                     "source": source_node,
                     "target": target_node,
                     "reason": "Failed to get pins"
-                })
+                }
+                errors = [pin_errors[n] for n in (source_node, target_node) if n in pin_errors]
+                if errors:
+                    failure["error"] = "; ".join(errors)
+                failed_connections.append(failure)
                 continue
 
-            # Try to find execution pins first
-            exec_connected = False
-            for out_pin in source_pins.get("output_pins", []):
-                if "exec" in out_pin.get("type", "").lower() or out_pin.get("name") == "then":
-                    for in_pin in target_pins.get("input_pins", []):
-                        if "exec" in in_pin.get("type", "").lower() or in_pin.get("name") == "execute":
-                            connections_made.append({
-                                "source_node": source_node,
-                                "source_pin": out_pin["name"],
-                                "target_node": target_node,
-                                "target_pin": in_pin["name"],
-                                "connection_type": "execution"
-                            })
-                            exec_connected = True
-                            break
-                    if exec_connected:
-                        break
+            source_outputs = source_pins[1]
+            target_inputs = target_pins[0]
+
+            # Try to find execution pins first; the input side is only
+            # searched when the source exposes an exec output
+            out_pin = next((p for p in source_outputs if p.is_exec or p.name == "then"), None)
+            in_pin = next((p for p in target_inputs if p.is_exec or p.name == "execute"), None) if out_pin else None
+            exec_connected = in_pin is not None
+            if exec_connected:
+                connections_made.append({
+                    "source_node": source_node,
+                    "source_pin": out_pin.name,
+                    "target_node": target_node,
+                    "target_pin": in_pin.name,
+                    "connection_type": "execution"
+                })
+
+            # Then try data pins (match by identical type), bucketing inputs
+            # by type so each output is paired with a single dict lookup
+            inputs_by_type = {}
+            for in_pin in target_inputs:
+                if not in_pin.is_exec:
+                    inputs_by_type.setdefault(in_pin.type, []).append(in_pin)
 
-            # Then try data pins (match by compatible types)
+            # Limit to 3 data connections per pair; stop searching once reached
             data_connections = []
-            for out_pin in source_pins.get("output_pins", []):
-                if "exec" in out_pin.get("type", "").lower():
+            for out_pin in source_outputs:
+                if out_pin.is_exec:
                     continue
-                for in_pin in target_pins.get("input_pins", []):
-                    if "exec" in in_pin.get("type", "").lower():
-                        continue
-                    # Simple type matching
-                    if out_pin.get("type") == in_pin.get("type"):
-                        data_connections.append({
-                            "source_node": source_node,
-                            "source_pin": out_pin["name"],
-                            "target_node": target_node,
-                            "target_pin": in_pin["name"],
-                            "connection_type": "data"
-                        })
+                for in_pin in inputs_by_type.get(out_pin.type, ()):
+                    data_connections.append({
+                        "source_node": source_node,
+                        "source_pin": out_pin.name,
+                        "target_node": target_node,
+                        "target_pin": in_pin.name,
+                        "connection_type": "data"
+                    })
+                    if len(data_connections) >= 3:
+                        break
+                if len(data_connections) >= 3:
+                    break
 
-            connections_made.extend(data_connections[:3])  # Limit to 3 data connections per pair
+            connections_made.extend(data_connections)
 
             if not exec_connected and not data_connections:
                 warnings.append(f"No compatible pins found between {source_node} and {target_node}")
@@ -350,6 +568,7 @@ def auto_connect_blueprint_chain(data: Dict[str, Any]) -> Dict[str, Any]:
             "connections_made": len(connections_made),
             "connections": connections_made,
             "failed_connections": failed_connections,
+            "missing_nodes": missing_nodes,
             "warnings": warnings,
             "message": f"Processed {len(node_chain)} nodes, made {len(connections_made)} connection suggestions"
         }
@@ -358,6 +577,18 @@ def auto_connect_blueprint_chain(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": f"Auto-connect failed: {e}"}
 
 
+def _data_suggestion(out_pin: PinInfo, in_pin: PinInfo, confidence: float) -> Dict[str, Any]:
+    """Suggestion record for one output/input data pin pair"""
+    return {
+        "source_pin": out_pin.name,
+        "target_pin": in_pin.name,
+        "source_type": out_pin.type,
+        "target_type": in_pin.type,
+        "confidence": confidence,
+        "type": "data"
+    }
+
+
 def suggest_blueprint_connections(data: Dict[str, Any]) -> Dict[str, Any]:
     """Get ranked connection suggestions between two nodes.
 
@@ -375,75 +606,78 @@ def suggest_blueprint_connections(data: Dict[str, Any]) -> Dict[str, Any]:
     if not all([blueprint_path, source_node, target_node]):
         return {"success": False, "error": "blueprint_path, source_node, and target_node are required"}
 
+    function_name = data.get("function_name", "EventGraph") or "EventGraph"
+
     try:
-        source_pins = get_blueprint_node_pins({
-            "blueprint_path": blueprint_path,
-            "node_name": source_node
-        })
+        graph, error = _resolve_graph(blueprint_path, function_name)
+        if error:
+            return error
 
-        target_pins = get_blueprint_node_pins({
-            "blueprint_path": blueprint_path,
-            "node_name": target_node
-        })
+        source_pins = _fetch_pins_internal(graph, blueprint_path, function_name, source_node)
+        if source_pins is None:
+            return {"success": False, "error": f"Node not found: {source_node}"}
+
+        target_pins = _fetch_pins_internal(graph, blueprint_path, function_name, target_node)
+        if target_pins is None:
+            return {"success": False, "error": f"Node not found: {target_node}"}
 
-        if not source_pins.get("success"):
-            return source_pins
-        if not target_pins.get("success"):
-            return target_pins
+        source_outputs = source_pins[1]
+        target_inputs = target_pins[0]
 
         suggestions = []
         execution_connection = None
 
-        # Find execution connections
-        for out_pin in source_pins.get("output_pins", []):
-            out_type = out_pin.get("type", "").lower()
-            if "exec" in out_type or out_pin.get("name") in ["then", "Then", "execute", "Execute"]:
-                for in_pin in target_pins.get("input_pins", []):
-                    in_type = in_pin.get("type", "").lower()
-                    if "exec" in in_type or in_pin.get("name") in ["execute", "Execute"]:
-                        execution_connection = {
-                            "source_pin": out_pin["name"],
-                            "target_pin": in_pin["name"],
-                            "confidence": 1.0,
-                            "type": "execution"
-                        }
-                        break
-                if execution_connection:
-                    break
+        # Find execution connections. The matching input does not depend on
+        # the output, so each side is searched once
+        out_pin = next((p for p in source_outputs
+                        if p.is_exec or p.name in ("then", "Then", "execute", "Execute")), None)
+        in_pin = next((p for p in target_inputs
+                       if p.is_exec or p.name in ("execute", "Execute")), None) if out_pin else None
+        if in_pin is not None:
+            execution_connection = {
+                "source_pin": out_pin.name,
+                "target_pin": in_pin.name,
+                "confidence": 1.0,
+                "type": "execution"
+            }
 
-        # Find data connections
-        data_connections = []
-        for out_pin in source_pins.get("output_pins", []):
-            out_type = out_pin.get("type", "")
-            if "exec" in out_type.lower():
+        # Find data connections. Inputs are bucketed by exact type and by
+        # lowercased name so each output is paired through dict lookups; only
+        # object-typed pins still need a pairwise pass for the weakest rule.
+        inputs_by_type = {}
+        inputs_by_name = {}
+        object_inputs = []
+        for in_pin in target_inputs:
+            if in_pin.is_exec:
                 continue
-
-            for in_pin in target_pins.get("input_pins", []):
-                in_type = in_pin.get("type", "")
-                if "exec" in in_type.lower():
-                    continue
-
-                # Calculate confidence based on type match
-                confidence = 0.0
-                if out_type == in_type:
-                    confidence = 1.0
-                elif out_pin["name"].lower() == in_pin["name"].lower():
-                    confidence = 0.8
-                elif "object" in out_type.lower() and "object" in in_type.lower():
-                    confidence = 0.5
-
-                if confidence > 0:
-                    data_connections.append({
-                        "source_pin": out_pin["name"],
-                        "target_pin": in_pin["name"],
-                        "source_type": out_type,
-                        "target_type": in_type,
-                        "confidence": confidence,
-                        "type": "data"
-                    })
-
-        # Sort by confidence
-        data_connections.sort(key=lambda x: x["confidence"], reverse=True)
+            in_name = in_pin.name.lower()
+            inputs_by_type.setdefault(in_pin.type, []).append(in_pin)
+            inputs_by_name.setdefault(in_name, []).append(in_pin)
+            if in_pin.kind == _PIN_OBJECT:
+                object_inputs.append((in_pin, in_name))
+
+        # One list per confidence tier, each in output-then-input order
+        exact_matches = []
+        name_matches = []
+        object_matches = []
+        for out_pin in source_outputs:
+            if out_pin.is_exec:
+                continue
+            out_type = out_pin.type
+            out_name = out_pin.name.lower()
+
+            for in_pin in inputs_by_type.get(out_type, ()):
+                exact_matches.append(_data_suggestion(out_pin, in_pin, 1.0))
+            for in_pin in inputs_by_name.get(out_name, ()):
+                if in_pin.type != out_type:
+                    name_matches.append(_data_suggestion(out_pin, in_pin, 0.8))
+            if out_pin.kind == _PIN_OBJECT:
+                for in_pin, in_name in object_inputs:
+                    if in_pin.type != out_type and in_name != out_name:
+                        object_matches.append(_data_suggestion(out_pin, in_pin, 0.5))
+
+        # Concatenating the tiers gives the same order as a stable sort by confidence
+        data_connections = exact_matches + name_matches + object_matches
 
         return {
             "success": True,
@@ -474,44 +708,44 @@ def get_blueprint_graph_connections(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": "blueprint_path is required"}
 
     try:
-        blueprint = _load_blueprint(blueprint_path)
-        if not blueprint:
-            return {"success": False, "error": f"Blueprint not found: {blueprint_path}"}
-
-        graph = _get_blueprint_graph(blueprint, function_name)
-        if not graph:
-            return {"success": False, "error": f"Function graph not found: {function_name}"}
+        graph, error = _resolve_graph(blueprint_path, function_name)
+        if error:
+            return error
 
         connections = []
         nodes_info = []
 
         # Get all nodes
         nodes = graph.get_editor_property("nodes")
+        # Linked pins resolve to nodes of this same graph, which stay alive in
+        # `nodes` for the whole call, so their names can be looked up by id
+        node_names = {}
 
         for node in nodes:
             node_name = node.get_name()
-            node_class = node.get_class().get_name()
-
+            node_names[id(node)] = node_name
             nodes_info.append({
                 "name": node_name,
-                "class": node_class
+                "class": node.get_class().get_name()
             })
 
-            # Get pins and their connections
+        for node in nodes:
+            node_name = node_names[id(node)]
+            # Each edge is enumerated once, from its source (output) pin
             try:
-                pins = node.get_editor_property("pins")
-                for pin in pins:
-                    # Check if this is an output pin with connections
-                    if pin.get_editor_property("direction") == 1:  # Output
-                        linked_pins = pin.get_editor_property("linked_to")
-                        for linked_pin in linked_pins:
-                            target_node = linked_pin.get_outer()
-                            connections.append({
-                                "source_node": node_name,
-                                "source_pin": pin.get_name(),
-                                "target_node": target_node.get_name() if target_node else "unknown",
-                                "target_pin": linked_pin.get_name()
-                            })
+                for pin_name, linked_pins in _output_links(node):
+                    for linked_pin in linked_pins:
+                        target_node = linked_pin.get_outer()
+                        if target_node is None:
+                            target_name = "unknown"
+                        else:
+                            target_name = node_names.get(id(target_node)) or target_node.get_name()
+                        connections.append({
+                            "source_node": node_name,
+                            "source_pin": pin_name,
+                            "target_node": target_name,
+                            "target_pin": linked_pin.get_name()
+                        })
             except Exception:
                 pass
 
@@ -527,3 +761,14 @@ def get_blueprint_graph_connections(data: Dict[str, Any]) -> Dict[str, Any]:
 
     except Exception as e:
         return {"success": False, "error": f"Failed to get graph connections: {e}"}
+
+
+# Command dispatch table (built once, after all handlers are defined)
+_HANDLERS = {
+    "get_blueprint_node_pins": get_blueprint_node_pins,
+    "validate_blueprint_connection": validate_blueprint_connection,
+    "auto_connect_blueprint_chain": auto_connect_blueprint_chain,
+    "suggest_blueprint_connections": suggest_blueprint_connections,
+    "get_blueprint_graph_connections": get_blueprint_graph_connections,
+}
+_HANDLERS_GET = _HANDLERS.get
@@ -14,31 +14,39 @@ Supports:
 from typing import Dict, Any, List
 import traceback
 
+from editor_cache import asset_registry, class_filter, invalidate_asset_listings
+
+
+def _level_exists(level_path: str) -> bool:
+    """Check the asset registry for a level without loading anything"""
+    import unreal
+
+    # Registry lookups take the object path (/Game/Maps/Foo.Foo)
+    object_path = level_path if "." in level_path else level_path + "." + level_path.rsplit("/", 1)[-1]
+    if hasattr(unreal, "SoftObjectPath"):
+        asset_data = asset_registry().get_asset_by_object_path(unreal.SoftObjectPath(object_path))
+    else:
+        asset_data = asset_registry().get_asset_by_object_path(object_path)
+    return bool(asset_data and asset_data.is_valid())
+
 
 def handle_level_command(data: Dict[str, Any]) -> Dict[str, Any]:
     """Route level commands to appropriate handlers"""
-    cmd = data.get("type", "")
-
-    handlers = {
-        "load_level": load_level,
-        "save_level": save_level,
-        "get_current_level": get_current_level,
-        "list_levels": list_levels,
-        "create_sublevel": create_sublevel,
-    }
-
-    handler = handlers.get(cmd)
-    if handler:
-        try:
-            return handler(data)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }
-    else:
-        return {"success": False, "error": f"Unknown level command: {cmd}"}
+    handler = _HANDLERS_GET(data.get("type", ""))
+    if handler is None:
+        return {"success": False, "error": f"Unknown level command: {data.get('type', '')}"}
+    try:
+        return handler(data)
+    except Exception as e:
+        response = {"success": False, "error": str(e)}
+        # Formatting a traceback is costly; only do it when asked
+        if data.get("include_traceback", False):
+            response["traceback"] = traceback.format_exc()
+        return response
+    finally:
+        # A new sublevel is a new World asset
+        if handler is create_sublevel:
+            invalidate_asset_listings()
 
 
 def load_level(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -56,7 +64,7 @@ def load_level(data: Dict[str, Any]) -> Dict[str, Any]:
 
     try:
         # Check if level exists
-        if not unreal.EditorAssetLibrary.does_asset_exist(level_path):
+        if not _level_exists(level_path):
             return {"success": False, "error": f"Level not found: {level_path}"}
 
         # Load the level
@@ -140,21 +148,24 @@ def list_levels(data: Dict[str, Any]) -> Dict[str, Any]:
     path = data.get("path", "/Game")
 
     try:
-        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
-
-        # Filter for World assets (levels)
-        levels = []
-        all_assets = asset_registry.get_assets_by_path(path, True)
-
-        for asset_data in all_assets:
-            asset_class = str(asset_data.asset_class_path.asset_name) if hasattr(asset_data, 'asset_class_path') else str(asset_data.asset_class)
-
-            if "World" in asset_class or "Level" in asset_class:
-                levels.append({
-                    "name": str(asset_data.asset_name),
-                    "path": str(asset_data.package_name),
-                    "class": asset_class
-                })
+        # Let the registry select World assets (levels) natively
+        ar_filter = unreal.ARFilter(
+            package_paths=[path],
+            recursive_paths=True,
+            **class_filter("World")
+        )
+        all_assets = asset_registry().get_assets(ar_filter)
+
+        # The filter only admits World assets, so the class needs no per-row lookup
+        _str = str
+        levels = [
+            {
+                "name": _str(asset_data.asset_name),
+                "path": _str(asset_data.package_name),
+                "class": "World"
+            }
+            for asset_data in all_assets
+        ]
 
         return {
             "success": True,
@@ -192,3 +203,14 @@ def create_sublevel(data: Dict[str, Any]) -> Dict[str, Any]:
 
     except Exception as e:
         return {"success": False, "error": f"Failed to create sublevel: {e}"}
+
+
+# Command dispatch table (built once, after all handlers are defined)
+_HANDLERS = {
+    "load_level": load_level,
+    "save_level": save_level,
+    "get_current_level": get_current_level,
+    "list_levels": list_levels,
+    "create_sublevel": create_sublevel,
+}
+_HANDLERS_GET = _HANDLERS.get
@@ -6,49 +6,154 @@ Material creation and management tools.
 Supports:
 - list_materials
 - get_material_info
+- get_materials_info
 - create_material_instance
+- create_material_instances
 - apply_material_to_actor
+- apply_materials_to_actors
 - create_simple_material
+- flush_material_saves
 """
 
-from typing import Dict, Any, List, Optional
+from contextlib import contextmanager
+from fnmatch import translate
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, Any, List, Optional
+import re
 import traceback
 
+from editor_cache import (
+    asset_class_name, asset_registry, asset_tools, class_filter, find_actor_by_label,
+    find_actors_by_labels, invalidate_asset_listings,
+)
 
-def handle_material_command(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Route material commands to appropriate handlers"""
-    cmd = data.get("type", "")
-
-    handlers = {
-        "list_materials": list_materials,
-        "get_material_info": get_material_info,
-        "create_material_instance": create_material_instance,
-        "apply_material_to_actor": apply_material_to_actor,
-        "create_simple_material": create_simple_material,
-    }
 
-    handler = handlers.get(cmd)
-    if handler:
-        try:
-            return handler(data)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }
-    else:
-        return {"success": False, "error": f"Unknown material command: {cmd}"}
+_GAME_PREFIX = "/Game"
+
+
+@lru_cache(maxsize=1024)
+def _normalize_game_path(path: str) -> str:
+    """Prefix /Game unless the path is already under /Game"""
+    if path.startswith(_GAME_PREFIX):
+        return path
+    return "/Game/" + path.lstrip("/")
+
+
+def _join_asset_path(folder: str, name: str) -> str:
+    """Asset path for name inside folder, without doubling the separator"""
+    return folder.rstrip("/") + "/" + name
+
+
+# Asset classes reported by list_materials
+_MATERIAL_CLASSES = ("Material", "MaterialInstance", "MaterialInstanceConstant")
+
+
+# Per-request memo of _load_asset results, keyed by asset path. None outside
+# _asset_memo_enabled(); a batch applying one material to many actors loads it once.
+_asset_memo: Optional[Dict[str, Any]] = None
+
+
+@contextmanager
+def _asset_memo_enabled():
+    """Share asset loads for the duration of one request; nested uses join the outer scope"""
+    global _asset_memo
+    owner = _asset_memo is None
+    if owner:
+        _asset_memo = {}
+    try:
+        yield
+    finally:
+        if owner:
+            _asset_memo = None
+
+
+def _load_asset(path: str):
+    """Load an asset, or None if it does not exist.
+
+    load_asset already returns None for missing assets, so no separate
+    does_asset_exist call is made.
+    """
+    import unreal
+
+    memo = _asset_memo
+    if memo is not None and path in memo:
+        return memo[path]
+    try:
+        asset = unreal.load_asset(path)
+    except Exception:
+        asset = None
+    if memo is not None:
+        memo[path] = asset
+    return asset
+
+
+# Paths of assets created with autosave=False. They are written by
+# flush_material_saves, by the next batch creation, by the next material
+# command that does not defer, or once PENDING_SAVE_LIMIT are queued.
+# Keys keep insertion order and drop duplicates.
+PENDING_SAVE_LIMIT = 32
+_pending_saves: Dict[str, None] = {}
+
+
+def _save_or_defer(data: Dict[str, Any], path: str) -> bool:
+    """Save an asset now, or queue it when the caller passed autosave=False.
+
+    Returns True when the save was deferred.
+    """
+    import unreal
+
+    if data.get("autosave", True):
+        unreal.EditorAssetLibrary.save_asset(path)
+        return False
+    _pending_saves[path] = None
+    if len(_pending_saves) >= PENDING_SAVE_LIMIT:
+        _save_pending_assets()
+    return True
 
 
-def _find_actor_by_name(actor_name: str):
-    """Helper to find actor by label"""
+def _take_pending_assets() -> List[Any]:
+    """Loaded assets for every queued path, emptying the queue"""
+    paths = list(_pending_saves)
+    _pending_saves.clear()
+    return [asset for asset in map(_load_asset, paths) if asset]
+
+
+def _save_pending_assets() -> List[Any]:
+    """Save every queued asset in one pass; returns the assets saved"""
     import unreal
-    actors = unreal.EditorLevelLibrary.get_all_level_actors()
-    for actor in actors:
-        if actor.get_actor_label() == actor_name:
-            return actor
-    return None
+
+    assets = _take_pending_assets()
+    if assets:
+        unreal.EditorAssetLibrary.save_loaded_assets(assets, only_if_is_dirty=True)
+    return assets
+
+
+def handle_material_command(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Route material commands to appropriate handlers"""
+    handler = _HANDLERS_GET(data.get("type", ""))
+    if handler is None:
+        return {"success": False, "error": f"Unknown material command: {data.get('type', '')}"}
+    try:
+        with _asset_memo_enabled():
+            response = handler(data)
+    except Exception as e:
+        response = {"success": False, "error": str(e)}
+        # Formatting a traceback is costly; only do it when asked
+        if data.get("include_traceback", False):
+            response["traceback"] = traceback.format_exc()
+    finally:
+        if handler in _CREATING_HANDLERS:
+            invalidate_asset_listings()
+
+    # A run of autosave=False commands ends at the first command that does
+    # not defer; write the queue then so it is not left unsaved
+    if _pending_saves and data.get("autosave", True):
+        try:
+            _save_pending_assets()
+        except Exception as e:
+            response["pending_save_error"] = f"Queued material saves failed: {e}"
+    return response
 
 
 def list_materials(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -56,78 +161,107 @@ def list_materials(data: Dict[str, Any]) -> Dict[str, Any]:
 
     Args:
         path: Content browser path to search (default: "/Game")
-        pattern: Optional pattern to filter material names
+        pattern: Optional pattern to filter material names; a substring, or a
+            glob such as "M_Wood*" when it contains *, ? or [
         limit: Maximum number of materials to return (default: 50)
+        include_total: Count every match when a pattern is given (default: False)
     """
     import unreal
 
     path = data.get("path", "/Game")
     pattern = data.get("pattern", "")
     limit = data.get("limit", 50)
+    include_total = data.get("include_total", False)
 
     try:
-        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
-
-        # Get all assets by path, then filter for materials
-        all_assets = asset_registry.get_assets_by_path(path, recursive=True)
-
-        # Filter for material types
-        assets = []
-        for asset in all_assets:
-            try:
-                asset_type = str(asset.asset_class_path.asset_name) if hasattr(
-                    asset.asset_class_path, 'asset_name'
-                ) else str(asset.asset_class_path)
-
-                if asset_type in ['Material', 'MaterialInstance', 'MaterialInstanceConstant']:
-                    assets.append(asset)
-            except:
-                pass
-
-        # Apply pattern filter if specified
-        filtered_assets = assets
-        if pattern:
-            filtered_assets = []
+        # Let the registry select material assets natively
+        ar_filter = unreal.ARFilter(
+            package_paths=[path],
+            recursive_paths=True,
+            **class_filter(*_MATERIAL_CLASSES)
+        )
+        assets = asset_registry().get_assets(ar_filter)
+
+        # Stream the pattern filter so matching stops once limit rows are found;
+        # each name is stringified once and reused for the row
+        named = ((str(asset.asset_name), asset) for asset in assets)
+        if pattern and any(c in pattern for c in "*?["):
+            # Glob patterns match the whole name, compiled once per call
+            match = re.compile(translate(pattern), re.IGNORECASE).match
+            matches = ((name, asset) for name, asset in named if match(name))
+        elif pattern:
             pattern_lower = pattern.lower()
-            for asset in assets:
-                asset_name = str(asset.asset_name).lower()
-                if pattern_lower in asset_name:
-                    filtered_assets.append(asset)
-
-        # Build material list with limit
-        material_list = []
-        for i, asset in enumerate(filtered_assets):
-            if i >= limit:
-                break
+            matches = ((name, asset) for name, asset in named if pattern_lower in name.lower())
+        else:
+            matches = named
 
-            try:
-                asset_type = str(asset.asset_class_path.asset_name) if hasattr(
-                    asset.asset_class_path, 'asset_name'
-                ) else str(asset.asset_class_path)
-            except:
-                asset_type = "Unknown"
-
-            material_info = {
-                "name": str(asset.asset_name),
+        material_list = [
+            {
+                "name": name,
                 "path": str(asset.package_name),
-                "type": asset_type
+                "type": asset_class_name(asset)
             }
+            for name, asset in islice(matches, max(limit, 0))
+        ]
 
-            material_list.append(material_info)
-
-        return {
+        result = {
             "success": True,
             "materials": material_list,
-            "total_count": len(filtered_assets),
             "returned_count": len(material_list),
             "path": path,
             "pattern": pattern if pattern else None
         }
+        # Without a pattern the total is free; with one it costs a full scan
+        if not pattern:
+            result["total_count"] = len(assets)
+        elif include_total:
+            result["total_count"] = len(material_list) + sum(1 for _ in matches)
+        return result
 
     except Exception as e:
         return {"success": False, "error": f"Failed to list materials: {e}"}
 
 
+def _scalar_entry(name, value) -> Dict[str, Any]:
+    return {"name": str(name), "value": float(value)}
+
+
+def _vector_entry(name, value) -> Dict[str, Any]:
+    return {
+        "name": str(name),
+        "value": {
+            "r": float(value.r),
+            "g": float(value.g),
+            "b": float(value.b),
+            "a": float(value.a)
+        }
+    }
+
+
+def _texture_entry(name, texture) -> Dict[str, Any]:
+    return {"name": str(name), "texture": str(texture.get_path_name()) if texture else None}
+
+
+def _read_parameters(material, overrides_property: str, entry,
+                     names_method: str, value_method: str) -> List[Dict[str, Any]]:
+    """Parameter overrides of a material instance.
+
+    Reads the instance's override array (e.g. scalar_parameter_values) in one
+    call; engines that do not expose it fall back to a per-name value lookup.
+    """
+    try:
+        return [entry(p.parameter_info.name, p.parameter_value)
+                for p in material.get_editor_property(overrides_property)]
+    except Exception:
+        pass
+
+    try:
+        get_value = getattr(material, value_method)
+        return [entry(name, get_value(name)) for name in getattr(material, names_method)()]
+    except Exception:
+        return []
+
+
 def get_material_info(data: Dict[str, Any]) -> Dict[str, Any]:
     """Get detailed information about a material.
 
@@ -141,19 +275,13 @@ def get_material_info(data: Dict[str, Any]) -> Dict[str, Any]:
     if not material_path:
         return {"success": False, "error": "material_path is required"}
 
-    # Normalize path
-    if not material_path.startswith("/Game"):
-        material_path = f"/Game/{material_path}"
+    material_path = _normalize_game_path(material_path)
 
     try:
-        # Check if material exists
-        if not unreal.EditorAssetLibrary.does_asset_exist(material_path):
-            return {"success": False, "error": f"Material does not exist: {material_path}"}
-
         # Load the material
-        material = unreal.load_asset(material_path)
+        material = _load_asset(material_path)
         if not material:
-            return {"success": False, "error": f"Failed to load material: {material_path}"}
+            return {"success": False, "error": f"Material does not exist: {material_path}"}
 
         info = {
             "success": True,
@@ -180,55 +308,16 @@ def get_material_info(data: Dict[str, Any]) -> Dict[str, Any]:
                 if parent:
                     info["parent_material"] = str(parent.get_path_name())
 
-                # Get scalar parameters
-                scalar_params = []
-                try:
-                    scalar_param_names = material.get_scalar_parameter_names()
-                    for param_name in scalar_param_names:
-                        value = material.get_scalar_parameter_value(param_name)
-                        scalar_params.append({
-                            "name": str(param_name),
-                            "value": float(value)
-                        })
-                except Exception:
-                    pass
-
-                info["scalar_parameters"] = scalar_params
-
-                # Get vector parameters
-                vector_params = []
-                try:
-                    vector_param_names = material.get_vector_parameter_names()
-                    for param_name in vector_param_names:
-                        value = material.get_vector_parameter_value(param_name)
-                        vector_params.append({
-                            "name": str(param_name),
-                            "value": {
-                                "r": float(value.r),
-                                "g": float(value.g),
-                                "b": float(value.b),
-                                "a": float(value.a)
-                            }
-                        })
-                except Exception:
-                    pass
-
-                info["vector_parameters"] = vector_params
-
-                # Get texture parameters
-                texture_params = []
-                try:
-                    texture_param_names = material.get_texture_parameter_names()
-                    for param_name in texture_param_names:
-                        texture = material.get_texture_parameter_value(param_name)
-                        texture_params.append({
-                            "name": str(param_name),
-                            "texture": str(texture.get_path_name()) if texture else None
-                        })
-                except Exception:
-                    pass
-
-                info["texture_parameters"] = texture_params
+                # Parameter overrides come back as whole arrays, one read per kind
+                info["scalar_parameters"] = _read_parameters(
+                    material, 'scalar_parameter_values', _scalar_entry,
+                    'get_scalar_parameter_names', 'get_scalar_parameter_value')
+                info["vector_parameters"] = _read_parameters(
+                    material, 'vector_parameter_values', _vector_entry,
+                    'get_vector_parameter_names', 'get_vector_parameter_value')
+                info["texture_parameters"] = _read_parameters(
+                    material, 'texture_parameter_values', _texture_entry,
+                    'get_texture_parameter_names', 'get_texture_parameter_value')
 
             except Exception:
                 pass
@@ -239,6 +328,27 @@ def get_material_info(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": f"Failed to get material info: {e}"}
 
 
+def get_materials_info(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Get detailed information about several materials in one command.
+
+    Args:
+        material_paths: List of material paths
+    """
+    material_paths = data.get("material_paths", [])
+    if not material_paths:
+        return {"success": False, "error": "material_paths is required"}
+
+    # Each entry carries its own success flag; shared paths load once per request
+    materials = [get_material_info({"material_path": path}) for path in material_paths]
+    found = sum(1 for info in materials if info["success"])
+    return {
+        "success": found == len(materials),
+        "found_count": found,
+        "missing_count": len(materials) - found,
+        "materials": materials
+    }
+
+
 def create_material_instance(data: Dict[str, Any]) -> Dict[str, Any]:
     """Create a new material instance from a parent material.
 
@@ -247,6 +357,19 @@ def create_material_instance(data: Dict[str, Any]) -> Dict[str, Any]:
         instance_name: Name for the new material instance
         target_folder: Destination folder in content browser (default: "/Game/Materials")
         parameters: Dictionary of parameter overrides to set
+        autosave: Save the asset now (default True); False queues it for flush_material_saves
+    """
+    result, material_instance = _create_material_instance(data)
+    if material_instance:
+        # Save the asset
+        result["save_deferred"] = _save_or_defer(data, result["material_instance_path"])
+    return result
+
+
+def _create_material_instance(data: Dict[str, Any]):
+    """Create and parent one material instance without saving it.
+
+    Returns (response, material instance); the instance is None on failure.
     """
     import unreal
 
@@ -256,35 +379,27 @@ def create_material_instance(data: Dict[str, Any]) -> Dict[str, Any]:
     parameters = data.get("parameters", {})
 
     if not parent_material_path:
-        return {"success": False, "error": "parent_material_path is required"}
+        return {"success": False, "error": "parent_material_path is required"}, None
     if not instance_name:
-        return {"success": False, "error": "instance_name is required"}
+        return {"success": False, "error": "instance_name is required"}, None
 
-    # Normalize paths
-    if not parent_material_path.startswith("/Game"):
-        parent_material_path = f"/Game/{parent_material_path}"
+    parent_material_path = _normalize_game_path(parent_material_path)
 
     try:
         # Validate parent material exists
-        if not unreal.EditorAssetLibrary.does_asset_exist(parent_material_path):
-            return {"success": False, "error": f"Parent material does not exist: {parent_material_path}"}
-
-        parent_material = unreal.load_asset(parent_material_path)
+        parent_material = _load_asset(parent_material_path)
         if not parent_material:
-            return {"success": False, "error": f"Failed to load parent material: {parent_material_path}"}
+            return {"success": False, "error": f"Parent material does not exist: {parent_material_path}"}, None
 
         # Create the target path
-        target_path = f"{target_folder}/{instance_name}"
+        target_path = _join_asset_path(target_folder, instance_name)
 
         # Check if material instance already exists
         if unreal.EditorAssetLibrary.does_asset_exist(target_path):
-            return {"success": False, "error": f"Material instance already exists: {target_path}"}
-
-        # Create material instance using AssetTools
-        asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+            return {"success": False, "error": f"Material instance already exists: {target_path}"}, None
 
         # Create material instance constant
-        material_instance = asset_tools.create_asset(
+        material_instance = asset_tools().create_asset(
             asset_name=instance_name,
             package_path=target_folder,
             asset_class=unreal.MaterialInstanceConstant,
@@ -292,7 +407,7 @@ def create_material_instance(data: Dict[str, Any]) -> Dict[str, Any]:
         )
 
         if not material_instance:
-            return {"success": False, "error": "Failed to create material instance asset"}
+            return {"success": False, "error": "Failed to create material instance asset"}, None
 
         # Set parent material
         material_instance.set_editor_property('parent', parent_material)
@@ -301,19 +416,54 @@ def create_material_instance(data: Dict[str, Any]) -> Dict[str, Any]:
         if parameters:
             _apply_material_parameters(material_instance, parameters)
 
-        # Save the asset
-        unreal.EditorAssetLibrary.save_asset(target_path)
-
         return {
             "success": True,
             "material_instance_path": target_path,
             "parent_material": parent_material_path,
             "name": instance_name,
             "applied_parameters": list(parameters.keys()) if parameters else []
+        }, material_instance
+
+    except Exception as e:
+        return {"success": False, "error": f"Failed to create material instance: {e}"}, None
+
+
+def create_material_instances(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Create several material instances and save them together.
+
+    Args:
+        instances: List of {parent_material_path, instance_name, target_folder, parameters}
+    """
+    import unreal
+
+    instances = data.get("instances", [])
+    if not instances:
+        return {"success": False, "error": "instances is required"}
+
+    try:
+        results = []
+        created = []
+        with unreal.ScopedEditorTransaction("Create material instances"):
+            for item in instances:
+                result, material_instance = _create_material_instance(item)
+                results.append(result)
+                if material_instance:
+                    created.append(material_instance)
+
+        # One save pass for the whole batch, including any deferred saves
+        to_save = created + _take_pending_assets()
+        if to_save:
+            unreal.EditorAssetLibrary.save_loaded_assets(to_save, only_if_is_dirty=False)
+
+        return {
+            "success": len(created) == len(results),
+            "created_count": len(created),
+            "failed_count": len(results) - len(created),
+            "results": results
         }
 
     except Exception as e:
-        return {"success": False, "error": f"Failed to create material instance: {e}"}
+        return {"success": False, "error": f"Failed to create material instances: {e}"}
 
 
 def apply_material_to_actor(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -335,44 +485,23 @@ def apply_material_to_actor(data: Dict[str, Any]) -> Dict[str, Any]:
     if not material_path:
         return {"success": False, "error": "material_path is required"}
 
-    # Normalize path
-    if not material_path.startswith("/Game"):
-        material_path = f"/Game/{material_path}"
+    material_path = _normalize_game_path(material_path)
 
     try:
         # Find the actor by name
-        actor = _find_actor_by_name(actor_name)
+        actor = find_actor_by_label(actor_name)
         if not actor:
             return {"success": False, "error": f"Actor not found: {actor_name}"}
 
         # Load the material
-        if not unreal.EditorAssetLibrary.does_asset_exist(material_path):
-            return {"success": False, "error": f"Material does not exist: {material_path}"}
-
-        material = unreal.load_asset(material_path)
+        material = _load_asset(material_path)
         if not material:
-            return {"success": False, "error": f"Failed to load material: {material_path}"}
-
-        # Get the static mesh component
-        static_mesh_component = None
-
-        # Try different ways to get the mesh component
-        if hasattr(actor, 'static_mesh_component'):
-            static_mesh_component = actor.static_mesh_component
-        elif hasattr(actor, 'get_component_by_class'):
-            static_mesh_component = actor.get_component_by_class(unreal.StaticMeshComponent)
-        else:
-            # Get components and find first StaticMeshComponent
-            components = actor.get_components_by_class(unreal.StaticMeshComponent)
-            if components and len(components) > 0:
-                static_mesh_component = components[0]
+            return {"success": False, "error": f"Material does not exist: {material_path}"}
 
+        static_mesh_component = _apply_material(actor, material, slot_index)
         if not static_mesh_component:
             return {"success": False, "error": f"No static mesh component found on actor: {actor_name}"}
 
-        # Apply the material to the specified slot
-        static_mesh_component.set_material(slot_index, material)
-
         return {
             "success": True,
             "actor_name": actor_name,
@@ -385,6 +514,115 @@ def apply_material_to_actor(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": f"Failed to apply material to actor: {e}"}
 
 
+def _mesh_from_property(actor):
+    return actor.static_mesh_component
+
+
+def _mesh_from_component_lookup(actor):
+    import unreal
+    return actor.get_component_by_class(unreal.StaticMeshComponent)
+
+
+def _mesh_from_component_list(actor):
+    import unreal
+    components = actor.get_components_by_class(unreal.StaticMeshComponent)
+    return components[0] if components else None
+
+
+# How to reach the static mesh component, chosen once per actor wrapper type
+_MESH_LOOKUPS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _static_mesh_component(actor):
+    """First static mesh component of an actor, or None"""
+    actor_type = type(actor)
+    lookup = _MESH_LOOKUPS.get(actor_type)
+    if lookup is None:
+        # Try different ways to get the mesh component
+        if hasattr(actor, 'static_mesh_component'):
+            lookup = _mesh_from_property
+        elif hasattr(actor, 'get_component_by_class'):
+            lookup = _mesh_from_component_lookup
+        else:
+            lookup = _mesh_from_component_list
+        _MESH_LOOKUPS[actor_type] = lookup
+    return lookup(actor)
+
+
+def _apply_material(actor, material, slot_index: int):
+    """Set a material slot on an actor's static mesh component; returns the component or None"""
+    static_mesh_component = _static_mesh_component(actor)
+    if not static_mesh_component:
+        return None
+
+    # Apply the material to the specified slot
+    static_mesh_component.set_material(slot_index, material)
+    return static_mesh_component
+
+
+def apply_materials_to_actors(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply materials to several actors in one command.
+
+    Args:
+        assignments: List of {actor_name, material_path, slot_index}
+    """
+    import unreal
+
+    assignments = data.get("assignments", [])
+    if not assignments:
+        return {"success": False, "error": "assignments is required"}
+
+    try:
+        # Resolve every actor with at most one level scan; _load_asset loads
+        # each distinct material once however many actors share it
+        actors = find_actors_by_labels({a["actor_name"] for a in assignments if a.get("actor_name")})
+
+        results = []
+        for assignment in assignments:
+            actor_name = assignment.get("actor_name", "")
+            material_path = assignment.get("material_path", "")
+            slot_index = assignment.get("slot_index", 0)
+            if material_path:
+                material_path = _normalize_game_path(material_path)
+
+            result = {"actor_name": actor_name, "material_path": material_path, "slot_index": slot_index}
+            results.append(result)
+
+            if not actor_name or not material_path:
+                result.update(success=False, error="actor_name and material_path are required")
+                continue
+            actor = actors.get(actor_name)
+            if not actor:
+                result.update(success=False, error=f"Actor not found: {actor_name}")
+                continue
+
+            material = _load_asset(material_path)
+            if not material:
+                result.update(success=False, error=f"Material does not exist: {material_path}")
+                continue
+
+            try:
+                component = _apply_material(actor, material, slot_index)
+            except Exception as e:
+                result.update(success=False, error=str(e))
+                continue
+            if not component:
+                result.update(success=False, error=f"No static mesh component found on actor: {actor_name}")
+                continue
+            result.update(success=True, component_name=component.get_name())
+
+        applied = sum(1 for r in results if r["success"])
+        return {
+            "success": applied == len(results),
+            "applied_count": applied,
+            "failed_count": len(results) - applied,
+            "results": results
+        }
+
+    except Exception as e:
+        return {"success": False, "error": f"Failed to apply materials to actors: {e}"}
+
+
 def create_simple_material(data: Dict[str, Any]) -> Dict[str, Any]:
     """Create a simple material with basic parameters.
 
@@ -395,6 +633,7 @@ def create_simple_material(data: Dict[str, Any]) -> Dict[str, Any]:
         metallic: Metallic value (0-1) (default: 0.0)
         roughness: Roughness value (0-1) (default: 0.5)
         emissive: RGB emissive color values (0-1 range)
+        autosave: Save the asset now (default True); False queues it for flush_material_saves
     """
     import unreal
 
@@ -410,7 +649,7 @@ def create_simple_material(data: Dict[str, Any]) -> Dict[str, Any]:
 
     try:
         # Create the target path
-        target_path = f"{target_folder}/{material_name}"
+        target_path = _join_asset_path(target_folder, material_name)
 
         # Check if material already exists
         if unreal.EditorAssetLibrary.does_asset_exist(target_path):
@@ -421,9 +660,7 @@ def create_simple_material(data: Dict[str, Any]) -> Dict[str, Any]:
             unreal.EditorAssetLibrary.make_directory(target_folder)
 
         # Create material using AssetTools
-        asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-
-        material = asset_tools.create_asset(
+        material = asset_tools().create_asset(
             asset_name=material_name,
             package_path=target_folder,
             asset_class=unreal.Material,
@@ -436,81 +673,57 @@ def create_simple_material(data: Dict[str, Any]) -> Dict[str, Any]:
         # Set basic material properties
         material.set_editor_property('two_sided', False)
 
-        # Create and connect material expression nodes
-        material_editor = unreal.MaterialEditingLibrary
-
-        # Base Color
+        # Describe every expression node up front, then create and connect
+        # them in one transaction with a single property write per node
+        nodes = []
         if base_color:
-            color_node = unreal.MaterialEditingLibrary.create_material_expression(
-                material, unreal.MaterialExpressionVectorParameter
-            )
-            color_node.set_editor_property('parameter_name', 'BaseColor')
-            color_node.set_editor_property('default_value',
-                unreal.LinearColor(
+            nodes.append((unreal.MaterialExpressionVectorParameter, {
+                'parameter_name': 'BaseColor',
+                'default_value': unreal.LinearColor(
                     base_color.get('r', 1.0),
                     base_color.get('g', 1.0),
                     base_color.get('b', 1.0),
                     1.0
                 )
-            )
-
-            # Connect to base color
-            material_editor.connect_material_property(
-                color_node, '', unreal.MaterialProperty.MP_BASE_COLOR
-            )
-
-        # Metallic
+            }, unreal.MaterialProperty.MP_BASE_COLOR))
         if metallic != 0.0:
-            metallic_node = unreal.MaterialEditingLibrary.create_material_expression(
-                material, unreal.MaterialExpressionScalarParameter
-            )
-            metallic_node.set_editor_property('parameter_name', 'Metallic')
-            metallic_node.set_editor_property('default_value', metallic)
-
-            material_editor.connect_material_property(
-                metallic_node, '', unreal.MaterialProperty.MP_METALLIC
-            )
-
-        # Roughness
-        roughness_node = unreal.MaterialEditingLibrary.create_material_expression(
-            material, unreal.MaterialExpressionScalarParameter
-        )
-        roughness_node.set_editor_property('parameter_name', 'Roughness')
-        roughness_node.set_editor_property('default_value', roughness)
-
-        material_editor.connect_material_property(
-            roughness_node, '', unreal.MaterialProperty.MP_ROUGHNESS
-        )
-
-        # Emissive
+            nodes.append((unreal.MaterialExpressionScalarParameter, {
+                'parameter_name': 'Metallic',
+                'default_value': metallic
+            }, unreal.MaterialProperty.MP_METALLIC))
+        nodes.append((unreal.MaterialExpressionScalarParameter, {
+            'parameter_name': 'Roughness',
+            'default_value': roughness
+        }, unreal.MaterialProperty.MP_ROUGHNESS))
         if emissive:
-            emissive_node = unreal.MaterialEditingLibrary.create_material_expression(
-                material, unreal.MaterialExpressionVectorParameter
-            )
-            emissive_node.set_editor_property('parameter_name', 'EmissiveColor')
-            emissive_node.set_editor_property('default_value',
-                unreal.LinearColor(
+            nodes.append((unreal.MaterialExpressionVectorParameter, {
+                'parameter_name': 'EmissiveColor',
+                'default_value': unreal.LinearColor(
                     emissive.get('r', 0.0),
                     emissive.get('g', 0.0),
                     emissive.get('b', 0.0),
                     1.0
                 )
-            )
+            }, unreal.MaterialProperty.MP_EMISSIVE_COLOR))
 
-            material_editor.connect_material_property(
-                emissive_node, '', unreal.MaterialProperty.MP_EMISSIVE_COLOR
-            )
+        material_editor = unreal.MaterialEditingLibrary
+        with unreal.ScopedEditorTransaction("Create simple material"):
+            for expression_class, properties, material_property in nodes:
+                node = material_editor.create_material_expression(material, expression_class)
+                node.set_editor_properties(properties)
+                material_editor.connect_material_property(node, '', material_property)
 
-        # Recompile the material
-        unreal.MaterialEditingLibrary.recompile_material(material)
+        # Recompile the material once, after the whole graph is built
+        material_editor.recompile_material(material)
 
         # Save the asset
-        unreal.EditorAssetLibrary.save_asset(target_path)
+        save_deferred = _save_or_defer(data, target_path)
 
         return {
             "success": True,
             "material_path": target_path,
             "name": material_name,
+            "save_deferred": save_deferred,
             "properties": {
                 "base_color": base_color,
                 "metallic": metallic,
@@ -523,29 +736,80 @@ def create_simple_material(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": f"Failed to create simple material: {e}"}
 
 
+def flush_material_saves(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Save every material asset queued by autosave=False in one pass"""
+    try:
+        assets = _save_pending_assets()
+        return {
+            "success": True,
+            "saved_count": len(assets),
+            "saved": [asset.get_path_name() for asset in assets]
+        }
+
+    except Exception as e:
+        return {"success": False, "error": f"Failed to flush saves: {e}"}
+
+
 def _apply_material_parameters(material_instance, parameters: Dict[str, Any]):
-    """Apply parameter overrides to a material instance."""
+    """Apply parameter overrides to a material instance.
+
+    Overrides are grouped by kind and written through MaterialEditingLibrary,
+    which does not refresh the instance per call; it is updated once at the end.
+    """
     import unreal
 
+    scalars = []
+    vectors = []
+    textures = []
     for param_name, param_value in parameters.items():
-        try:
-            if isinstance(param_value, (int, float)):
-                # Scalar parameter
-                material_instance.set_scalar_parameter_value(param_name, float(param_value))
-            elif isinstance(param_value, dict) and all(k in param_value for k in ['r', 'g', 'b']):
+        if isinstance(param_value, (int, float)):
+            scalars.append((param_name, float(param_value)))
+        elif isinstance(param_value, dict) and all(k in param_value for k in ['r', 'g', 'b']):
+            vectors.append((param_name, param_value))
+        elif isinstance(param_value, str):
+            textures.append((param_name, param_value))
+
+    editing = unreal.MaterialEditingLibrary
+    with unreal.ScopedEditorTransaction("Apply material parameters"):
+        for param_name, value in scalars:
+            try:
+                editing.set_material_instance_scalar_parameter_value(material_instance, param_name, value)
+            except Exception:
+                pass
+
+        for param_name, value in vectors:
+            try:
                 # Vector parameter (color)
-                color = unreal.LinearColor(
-                    param_value['r'],
-                    param_value['g'],
-                    param_value['b'],
-                    param_value.get('a', 1.0)
-                )
-                material_instance.set_vector_parameter_value(param_name, color)
-            elif isinstance(param_value, str):
-                # Texture parameter
-                if unreal.EditorAssetLibrary.does_asset_exist(param_value):
-                    texture = unreal.load_asset(param_value)
-                    if texture:
-                        material_instance.set_texture_parameter_value(param_name, texture)
-        except Exception:
-            pass
+                color = unreal.LinearColor(value['r'], value['g'], value['b'], value.get('a', 1.0))
+                editing.set_material_instance_vector_parameter_value(material_instance, param_name, color)
+            except Exception:
+                pass
+
+        for param_name, texture_path in textures:
+            try:
+                # Texture parameter; _load_asset loads a shared texture once
+                texture = _load_asset(texture_path)
+                if texture:
+                    editing.set_material_instance_texture_parameter_value(material_instance, param_name, texture)
+            except Exception:
+                pass
+
+        editing.update_material_instance(material_instance)
+
+
+# Command dispatch table (built once, after all handlers are defined)
+_HANDLERS = {
+    "list_materials": list_materials,
+    "get_material_info": get_material_info,
+    "get_materials_info": get_materials_info,
+    "create_material_instance": create_material_instance,
+    "create_material_instances": create_material_instances,
+    "apply_material_to_actor": apply_material_to_actor,
+    "apply_materials_to_actors": apply_materials_to_actors,
+    "create_simple_material": create_simple_material,
+    "flush_material_saves": flush_material_saves,
+}
+_HANDLERS_GET = _HANDLERS.get
+
+# Handlers that create assets and therefore invalidate cached asset listings
+_CREATING_HANDLERS = frozenset({create_material_instance, create_material_instances, create_simple_material})
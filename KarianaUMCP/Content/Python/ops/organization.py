@@ -12,9 +12,77 @@ Supports:
 - generate_organization_report
 """
 
+from collections import Counter
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
+import heapq
+import re
 import traceback
 
+from editor_cache import asset_class_name, asset_registry, asset_tools, invalidate_asset_listings
+
+
+# auto_tag keywords found in upper-cased asset names, and the tags each adds
+_KEYWORD_TAGS = {
+    "FPS": ("FPS",),
+    "JUMP": ("Movement", "Character"),
+    "FIRE": ("Combat", "Weapon"),
+    "SHOOT": ("Combat", "Weapon"),
+    "MOVE": ("Movement",),
+    "WALK": ("Movement",),
+    "RUN": ("Movement",),
+    "LOOK": ("Camera",),
+    "AIM": ("Camera",),
+    "RELOAD": ("Combat", "Weapon"),
+    "CROUCH": ("Movement", "Character"),
+}
+# One pass over the name; the lookahead also reports overlapping keywords
+_KEYWORD_RE = re.compile("(?=(" + "|".join(_KEYWORD_TAGS) + "))")
+# auto_tag tags added when the asset class name contains the key
+_CLASS_TAGS = ("Input", "Blueprint", "Material")
+
+
+def _auto_tags(asset_name: str, asset_class: str) -> List[str]:
+    """Tags implied by an asset's name and class"""
+    tags = [tag for match in _KEYWORD_RE.finditer(asset_name.upper()) for tag in _KEYWORD_TAGS[match.group(1)]]
+    tags.extend(tag for tag in _CLASS_TAGS if tag in asset_class)
+    return tags
+
+
+def _assets_under(paths: List[str]) -> List[Any]:
+    """AssetData for every asset below the given folders, without loading any"""
+    import unreal
+    return asset_registry().get_assets(unreal.ARFilter(package_paths=list(paths), recursive_paths=True))
+
+
+def _object_path(asset_data) -> str:
+    """Object path of an AssetData entry, as EditorAssetLibrary.list_assets reports it"""
+    return f"{asset_data.package_name}.{asset_data.asset_name}"
+
+
+def _known_directories(base_path: str) -> set:
+    """Every folder the registry knows below base_path, from a single query.
+
+    Anything missing from the set is still checked with does_directory_exist.
+    """
+    return set(asset_registry().get_sub_paths(base_path, True))
+
+
+def _ensure_directory(path: str, known: set) -> Optional[bool]:
+    """Make sure a folder exists, consulting known before asking the editor.
+
+    Returns None if it already existed, else whether make_directory succeeded.
+    """
+    import unreal
+
+    if path in known or unreal.EditorAssetLibrary.does_directory_exist(path):
+        known.add(path)
+        return None
+    success = unreal.EditorAssetLibrary.make_directory(path)
+    if success:
+        known.add(path)
+    return success
+
 
 def handle_organization_command(data: Dict[str, Any]) -> Dict[str, Any]:
     """Route organization commands to appropriate handlers"""
@@ -39,6 +107,10 @@ def handle_organization_command(data: Dict[str, Any]) -> Dict[str, Any]:
                 "error": str(e),
                 "traceback": traceback.format_exc()
             }
+        finally:
+            # Moved assets change every listing that covers either folder
+            if handler is organize_assets_by_type and not data.get("dry_run", False):
+                invalidate_asset_listings()
     else:
         return {"success": False, "error": f"Unknown organization command: {cmd}"}
 
@@ -75,6 +147,9 @@ def create_folder_structure(data: Dict[str, Any]) -> Dict[str, Any]:
         if isinstance(folder_structure, list):
             folder_structure = {folder: [] for folder in folder_structure}
 
+        # Folders the registry already knows need no existence check
+        known = _known_directories(base_path)
+
         # Create base path if it doesn't exist
         if not unreal.EditorAssetLibrary.does_directory_exist(base_path):
             unreal.EditorAssetLibrary.make_directory(base_path)
@@ -83,25 +158,17 @@ def create_folder_structure(data: Dict[str, Any]) -> Dict[str, Any]:
         # Create folder structure
         for parent_folder, subfolders in folder_structure.items():
             parent_path = f"{base_path}/{parent_folder}"
+            paths = [parent_path]
+            if isinstance(subfolders, list):
+                paths.extend(f"{parent_path}/{subfolder}" for subfolder in subfolders)
 
-            # Create parent folder
-            if not unreal.EditorAssetLibrary.does_directory_exist(parent_path):
-                success = unreal.EditorAssetLibrary.make_directory(parent_path)
+            # Create parent folder, then subfolders
+            for path in paths:
+                success = _ensure_directory(path, known)
                 if success:
-                    created_folders.append(parent_path)
-                else:
-                    failed_folders.append(parent_path)
-
-            # Create subfolders
-            if isinstance(subfolders, list):
-                for subfolder in subfolders:
-                    subfolder_path = f"{parent_path}/{subfolder}"
-                    if not unreal.EditorAssetLibrary.does_directory_exist(subfolder_path):
-                        success = unreal.EditorAssetLibrary.make_directory(subfolder_path)
-                        if success:
-                            created_folders.append(subfolder_path)
-                        else:
-                            failed_folders.append(subfolder_path)
+                    created_folders.append(path)
+                elif success is False:
+                    failed_folders.append(path)
 
         return {
             "success": True,
@@ -157,24 +224,24 @@ def organize_assets_by_type(data: Dict[str, Any]) -> Dict[str, Any]:
             }
 
         # Create necessary folders
+        known = _known_directories(target_base)
         for folder_path in set(organization_rules.values()):
-            if not unreal.EditorAssetLibrary.does_directory_exist(folder_path):
-                unreal.EditorAssetLibrary.make_directory(folder_path)
+            _ensure_directory(folder_path, known)
 
-        # Get all assets in source folder
-        assets = unreal.EditorAssetLibrary.list_assets(source_folder, recursive=True)
+        # Get all assets in source folder; class and name come from the
+        # registry, so only assets that are actually moved get loaded
+        assets = _assets_under([source_folder])
 
         moved_assets = []
         skipped_assets = []
         failed_assets = []
+        renames = []  # (asset, asset_path, target_folder, new_path, asset_name, asset_class)
+        claimed = set()  # Destinations already taken by an earlier rename in this batch
 
-        for asset_path in assets:
-            asset = unreal.load_asset(asset_path)
-            if not asset:
-                continue
-
-            asset_name = asset.get_name()
-            asset_class = asset.get_class().get_name()
+        for asset_data in assets:
+            asset_name = str(asset_data.asset_name)
+            asset_class = asset_class_name(asset_data)
+            asset_path = _object_path(asset_data)
 
             # Find target folder for this asset type
             target_folder = organization_rules.get(asset_class)
@@ -207,9 +274,34 @@ def organize_assets_by_type(data: Dict[str, Any]) -> Dict[str, Any]:
                     "to": new_path,
                     "dry_run": True
                 })
+            elif new_path in claimed or unreal.EditorAssetLibrary.does_asset_exist(new_path):
+                # rename_asset refused occupied destinations; keep reporting them
+                failed_assets.append({
+                    "name": asset_name,
+                    "class": asset_class,
+                    "path": asset_path,
+                    "target": new_path,
+                    "reason": "Destination already exists"
+                })
             else:
-                success = unreal.EditorAssetLibrary.rename_asset(asset_path, new_path)
-                if success:
+                asset = asset_data.get_asset()
+                if not asset:
+                    continue
+                claimed.add(new_path)
+                renames.append((asset, asset_path, target_folder, new_path, asset_name, asset_class))
+
+        # Move everything in one AssetTools call, so redirector fix-up and
+        # source control checkout happen once for the batch
+        if renames:
+            batch_ok = asset_tools().rename_assets([
+                unreal.AssetRenameData(asset, target_folder, asset_name)
+                for asset, _, target_folder, _, asset_name, _ in renames
+            ])
+            # rename_assets reports only overall success; judge each item by
+            # where its loaded object now lives. The source path is not usable
+            # for this, since a move leaves a redirector behind.
+            for asset, asset_path, _, new_path, asset_name, asset_class in renames:
+                if asset.get_path_name() == f"{new_path}.{asset_name}":
                     moved_assets.append({
                         "name": asset_name,
                         "class": asset_class,
@@ -225,7 +317,7 @@ def organize_assets_by_type(data: Dict[str, Any]) -> Dict[str, Any]:
                         "target": new_path
                     })
 
-        return {
+        result = {
             "success": True,
             "dry_run": dry_run,
             "source_folder": source_folder,
@@ -238,6 +330,9 @@ def organize_assets_by_type(data: Dict[str, Any]) -> Dict[str, Any]:
             "skipped_assets": skipped_assets[:10],
             "failed_assets": failed_assets
         }
+        if renames and not batch_ok:
+            result["warning"] = "rename_assets reported a failure; see failed_assets"
+        return result
 
     except Exception as e:
         return {"success": False, "error": f"Failed to organize assets: {e}"}
@@ -299,6 +394,9 @@ def organize_world_outliner(data: Dict[str, Any]) -> Dict[str, Any]:
 
         organized_actors = []
         skipped_actors = []
+        # Rule lookups per actor class; the first matching rule wins, so the
+        # ordered scan runs once per distinct class rather than once per actor
+        folder_for_class = {}
 
         for actor in all_actors:
             if not actor:
@@ -308,13 +406,24 @@ def organize_world_outliner(data: Dict[str, Any]) -> Dict[str, Any]:
             actor_class = actor.get_class().get_name()
 
             # Find matching folder path
-            folder_path = None
-            for class_pattern, path in organization_rules.items():
-                if class_pattern in actor_class:
-                    folder_path = path
-                    break
+            if actor_class in folder_for_class:
+                folder_path = folder_for_class[actor_class]
+            else:
+                folder_path = next((path for class_pattern, path in organization_rules.items()
+                                    if class_pattern in actor_class), None)
+                folder_for_class[actor_class] = folder_path
 
             if folder_path:
+                # Leave actors that are already in place alone; every set
+                # refreshes the outliner
+                if str(actor.get_folder_path()).strip("/") == folder_path.strip("/"):
+                    skipped_actors.append({
+                        "name": actor_name,
+                        "class": actor_class,
+                        "reason": "Already in correct folder"
+                    })
+                    continue
+
                 # Set folder path for actor
                 actor.set_folder_path(folder_path)
                 organized_actors.append({
@@ -382,40 +491,11 @@ def tag_assets(data: Dict[str, Any]) -> Dict[str, Any]:
             asset_name = asset.get_name()
             asset_class = asset.get_class().get_name()
 
-            # Generate auto tags if requested
+            # Generate auto tags if requested, removing duplicates in order
             applied_tags = list(tags)
             if auto_tag:
-                auto_tags = []
-
-                # Tag based on name patterns
-                name_upper = asset_name.upper()
-                if "FPS" in name_upper:
-                    auto_tags.append("FPS")
-                if "JUMP" in name_upper:
-                    auto_tags.extend(["Movement", "Character"])
-                if "FIRE" in name_upper or "SHOOT" in name_upper:
-                    auto_tags.extend(["Combat", "Weapon"])
-                if "MOVE" in name_upper or "WALK" in name_upper or "RUN" in name_upper:
-                    auto_tags.append("Movement")
-                if "LOOK" in name_upper or "AIM" in name_upper:
-                    auto_tags.append("Camera")
-                if "RELOAD" in name_upper:
-                    auto_tags.extend(["Combat", "Weapon"])
-                if "CROUCH" in name_upper:
-                    auto_tags.extend(["Movement", "Character"])
-
-                # Tag based on class
-                if "Input" in asset_class:
-                    auto_tags.append("Input")
-                if "Blueprint" in asset_class:
-                    auto_tags.append("Blueprint")
-                if "Material" in asset_class:
-                    auto_tags.append("Material")
-
-                applied_tags.extend(auto_tags)
-
-            # Remove duplicates
-            applied_tags = list(set(applied_tags))
+                applied_tags.extend(_auto_tags(asset_name, asset_class))
+            applied_tags = list(dict.fromkeys(applied_tags))
 
             # Apply tags as metadata
             for tag in applied_tags:
@@ -463,24 +543,24 @@ def search_assets_by_tag(data: Dict[str, Any]) -> Dict[str, Any]:
 
     try:
         # Get all assets in folder
-        assets = unreal.EditorAssetLibrary.list_assets(folder_path, recursive=True)
+        assets = _assets_under([folder_path])
 
         matching_assets = []
 
-        for asset_path in assets:
-            asset = unreal.load_asset(asset_path)
+        for asset_data in assets:
+            # Metadata tags live on the loaded package
+            asset = asset_data.get_asset()
             if not asset:
                 continue
 
-            asset_name = asset.get_name()
-            asset_class = asset.get_class().get_name()
+            asset_name = str(asset_data.asset_name)
+            asset_class = asset_class_name(asset_data)
+            asset_path = _object_path(asset_data)
 
-            # Check tags
-            asset_tags = []
-            for tag in tags:
-                has_tag = unreal.EditorAssetLibrary.get_metadata_tag(asset, tag)
-                if has_tag:
-                    asset_tags.append(tag)
+            # Check tags against every tag on the asset, fetched in one call
+            present = {str(tag) for tag, value in
+                       unreal.EditorAssetLibrary.get_metadata_tag_values(asset).items() if value}
+            asset_tags = [tag for tag in tags if tag in present]
 
             # Determine if this asset matches
             if match_all:
@@ -531,32 +611,22 @@ def generate_organization_report(data: Dict[str, Any]) -> Dict[str, Any]:
 
         # Analyze Content Browser
         total_assets = 0
-        assets_by_type = {}
-        assets_by_folder = {}
+        assets_by_type = Counter()
+        assets_by_folder = Counter()
 
         for base_path in content_browser_paths:
-            # Get all assets recursively
-            assets = unreal.EditorAssetLibrary.list_assets(base_path, recursive=True)
+            # Get all assets recursively; counting needs no loaded objects
+            assets = _assets_under([base_path])
             total_assets += len(assets)
 
-            for asset_path in assets:
-                asset = unreal.load_asset(asset_path)
-                if not asset:
-                    continue
-
-                asset_class = asset.get_class().get_name()
-
-                # Count by type
-                assets_by_type[asset_class] = assets_by_type.get(asset_class, 0) + 1
-
-                # Count by folder (immediate parent folder)
-                folder = "/".join(asset_path.split("/")[:-1])
-                assets_by_folder[folder] = assets_by_folder.get(folder, 0) + 1
+            # Count by type, and by folder (immediate parent folder)
+            assets_by_type.update(map(asset_class_name, assets))
+            assets_by_folder.update(str(asset_data.package_path) for asset_data in assets)
 
         report["content_browser"] = {
             "total_assets": total_assets,
-            "assets_by_type": dict(sorted(assets_by_type.items(), key=lambda x: x[1], reverse=True)),
-            "top_folders": dict(sorted(assets_by_folder.items(), key=lambda x: x[1], reverse=True)[:20])
+            "assets_by_type": dict(assets_by_type.most_common()),
+            "top_folders": dict(assets_by_folder.most_common(20))
         }
 
         # Analyze World Outliner
@@ -590,8 +660,8 @@ def generate_organization_report(data: Dict[str, Any]) -> Dict[str, Any]:
                 "organized_actors": organized_actors,
                 "unorganized_actors": unorganized_actors,
                 "organization_percentage": round((organized_actors / total_actors * 100), 2) if total_actors > 0 else 0,
-                "actors_by_class": dict(sorted(actors_by_class.items(), key=lambda x: x[1], reverse=True)[:15]),
-                "actors_by_folder": dict(sorted(actors_by_folder.items(), key=lambda x: x[1], reverse=True)[:15])
+                "actors_by_class": dict(heapq.nlargest(15, actors_by_class.items(), key=itemgetter(1))),
+                "actors_by_folder": dict(heapq.nlargest(15, actors_by_folder.items(), key=itemgetter(1)))
             }
 
         # Generate summary
@@ -12,6 +12,8 @@ Supports:
 from typing import Dict, Any, List, Optional
 import traceback
 
+from editor_cache import find_actor_by_label
+
 
 def handle_physics_command(data: Dict[str, Any]) -> Dict[str, Any]:
     """Route physics commands to appropriate handlers"""
@@ -37,16 +39,6 @@ def handle_physics_command(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": f"Unknown physics command: {cmd}"}
 
 
-def _find_actor_by_name(actor_name: str):
-    """Helper to find actor by label"""
-    import unreal
-    actors = unreal.EditorLevelLibrary.get_all_level_actors()
-    for actor in actors:
-        if actor.get_actor_label() == actor_name:
-            return actor
-    return None
-
-
 def _get_primitive_component(actor):
     """Get the primitive component from an actor"""
     import unreal
@@ -90,7 +82,7 @@ def enable_physics_on_actor(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": "actor_name is required"}
 
     try:
-        actor = _find_actor_by_name(actor_name)
+        actor = find_actor_by_label(actor_name)
         if not actor:
             return {"success": False, "error": f"Actor not found: {actor_name}"}
 
@@ -133,7 +125,7 @@ def disable_physics_on_actor(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": "actor_name is required"}
 
     try:
-        actor = _find_actor_by_name(actor_name)
+        actor = find_actor_by_label(actor_name)
         if not actor:
             return {"success": False, "error": f"Actor not found: {actor_name}"}
 
@@ -170,7 +162,7 @@ def get_actor_physics_status(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "error": "actor_name is required"}
 
     try:
-        actor = _find_actor_by_name(actor_name)
+        actor = find_actor_by_label(actor_name)
         if not actor:
             return {"success": False, "error": f"Actor not found: {actor_name}"}
 
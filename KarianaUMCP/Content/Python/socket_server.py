@@ -2,7 +2,8 @@
 KarianaUMCP Socket Server
 =========================
 Central orchestrator for all MCP tool requests.
-Listens on port 9877 for JSON commands.
+Listens on port 9877 for JSON commands (newline-delimited JSON, or
+4-byte length-prefixed MessagePack frames when msgspec is installed).
 
 Features:
 - Automatic instance detection and port allocation
@@ -13,6 +14,7 @@ Features:
 """
 
 import socket
+import struct
 import threading
 import json
 import traceback
@@ -55,6 +57,29 @@ try:
 except ImportError:
     SKILLS_LOADER_AVAILABLE = False
 
+# Optional length-prefixed MessagePack wire format (used by ngrok_proxy)
+try:
+    import msgspec
+    _msgpack_encoder = msgspec.msgpack.Encoder()
+    _msgpack_decoder = msgspec.msgpack.Decoder()
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# 4-byte big-endian length header for msgpack frames
+_FRAME_HEADER = struct.Struct('>I')
+
+# First bytes that identify a newline-delimited JSON client. A msgpack frame
+# header starting with one of these would declare a >150MB payload.
+_JSON_LEAD_BYTES = frozenset(b'{[ \t\r\n')
+
+# Larger frame headers are treated as corrupt and the connection is closed
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# Zero-length frame sent back to a msgpack client when msgspec is missing
+# here; an empty payload is never valid msgpack, so it is unambiguous
+_MSGPACK_UNSUPPORTED = _FRAME_HEADER.pack(0)
+
 
 class KarianaSocketServer:
     """Main socket server for MCP tool requests with instance management"""
@@ -140,18 +165,26 @@ class KarianaSocketServer:
             "create_blueprint": self._handle_blueprint_command,
             "add_blueprint_component": self._handle_blueprint_command,
             "get_blueprint_info": self._handle_blueprint_command,
+            "get_blueprint_info_many": self._handle_blueprint_command,
             "compile_blueprint": self._handle_blueprint_command,
             "open_blueprint_editor": self._handle_blueprint_command,
             "set_component_property": self._handle_blueprint_command,
             "set_component_transform": self._handle_blueprint_command,
             "get_blueprint_components": self._handle_blueprint_command,
+            "batch_blueprint_edit": self._handle_blueprint_command,
+            "add_blueprint_components_bulk": self._handle_blueprint_command,
 
             # Asset operations (from ops/asset.py)
             "import_asset": self._handle_asset_command,
+            "import_assets": self._handle_asset_command,
             "list_assets": self._handle_asset_command,
             "create_material": self._handle_asset_command,
             "get_asset_info": self._handle_asset_command,
             "save_asset": self._handle_asset_command,
+            "delete_asset": self._handle_asset_command,
+            "delete_assets": self._handle_asset_command,
+            "duplicate_asset": self._handle_asset_command,
+            "duplicate_assets": self._handle_asset_command,
 
             # Level operations (from ops/level.py)
             "load_level": self._handle_level_command,
@@ -215,9 +248,13 @@ class KarianaSocketServer:
             # Material operations (from ops/material.py)
             "list_materials": self._handle_material_command,
             "get_material_info": self._handle_material_command,
+            "get_materials_info": self._handle_material_command,
             "create_material_instance": self._handle_material_command,
+            "create_material_instances": self._handle_material_command,
             "apply_material_to_actor": self._handle_material_command,
+            "apply_materials_to_actors": self._handle_material_command,
             "create_simple_material": self._handle_material_command,
+            "flush_material_saves": self._handle_material_command,
 
             # Validation operations (from ops/validation.py)
             "validate_actor_spawn": self._handle_validation_command,
@@ -321,28 +358,78 @@ class KarianaSocketServer:
 
     def _handle_client(self, client_socket: socket.socket, address):
         """Handle a single client connection"""
-        buffer = ""
         client_ip = address[0] if address else "unknown"
         try:
-            while self.running:
-                data = client_socket.recv(4096).decode('utf-8')
-                if not data:
-                    break
-
-                buffer += data
-
-                # Process complete JSON messages (newline-delimited)
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    if line.strip():
-                        response = self._process_message(line.strip(), client_ip=client_ip)
-                        client_socket.send((json.dumps(response) + '\n').encode('utf-8'))
+            first = client_socket.recv(4096)
+            if not first:
+                return
+
+            if first[0] in _JSON_LEAD_BYTES:
+                self._handle_json_client(client_socket, first, client_ip)
+            elif MSGSPEC_AVAILABLE:
+                self._handle_msgpack_client(client_socket, first, client_ip)
+            else:
+                # Tell the proxy to fall back to JSON instead of leaving it
+                # waiting for a frame that will never come
+                logger.warning(f"msgpack client {client_ip} rejected: msgspec not installed")
+                client_socket.sendall(_MSGPACK_UNSUPPORTED)
 
         except (socket.error, UnicodeDecodeError, json.JSONDecodeError) as e:
             logger.debug(f"Client error - {e}")
         finally:
             client_socket.close()
 
+    def _handle_json_client(self, client_socket: socket.socket, buffer: bytes, client_ip: str):
+        """Serve newline-delimited JSON messages"""
+        while self.running:
+            # Process complete JSON messages (newline-delimited)
+            while b'\n' in buffer:
+                line, buffer = buffer.split(b'\n', 1)
+                line = line.decode('utf-8').strip()
+                if line:
+                    response = self._process_message(line, client_ip=client_ip)
+                    client_socket.sendall((json.dumps(response) + '\n').encode('utf-8'))
+
+            data = client_socket.recv(4096)
+            if not data:
+                break
+            buffer += data
+
+    def _handle_msgpack_client(self, client_socket: socket.socket, first: bytes, client_ip: str):
+        """Serve 4-byte length-prefixed MessagePack frames"""
+        header_size = _FRAME_HEADER.size
+        buffer = bytearray(first)
+        while self.running:
+            # Process every complete frame in the buffer, then drop them in one go
+            pos = 0
+            while len(buffer) - pos >= header_size:
+                (length,) = _FRAME_HEADER.unpack_from(buffer, pos)
+                if length > MAX_FRAME_SIZE:
+                    logger.warning(f"Closing {client_ip}: frame of {length} bytes exceeds {MAX_FRAME_SIZE}")
+                    return
+                end = pos + header_size + length
+                if len(buffer) < end:
+                    break
+                frame = bytes(buffer[pos + header_size:end])
+                pos = end
+
+                try:
+                    data = _msgpack_decoder.decode(frame)
+                except msgspec.DecodeError as e:
+                    response = {"success": False, "error": f"Invalid msgpack: {e}"}
+                else:
+                    response = self._dispatch_message(data, client_ip=client_ip)
+
+                payload = _msgpack_encoder.encode(response)
+                client_socket.sendall(_FRAME_HEADER.pack(len(payload)) + payload)
+            if pos:
+                del buffer[:pos]
+
+            data = client_socket.recv(65536)
+            if not data:
+                break
+            buffer += data
+
     # Commands that DON'T need main thread (can run on any thread)
     THREAD_SAFE_COMMANDS = {
         "ping", "get_server_info", "get_instance_info", "list_functions",
@@ -353,6 +440,13 @@ class KarianaSocketServer:
         """Process a JSON message and return response"""
         try:
             data = json.loads(message)
+        except json.JSONDecodeError as e:
+            return {"success": False, "error": f"Invalid JSON: {e}"}
+        return self._dispatch_message(data, client_ip=client_ip)
+
+    def _dispatch_message(self, data: Dict[str, Any], client_ip: str = "unknown") -> Dict[str, Any]:
+        """Route a decoded message to its handler and return response"""
+        try:
             data["_client_ip"] = client_ip  # Inject client IP for rate-limiting
             command_type = data.get("type", "")
 
@@ -373,8 +467,6 @@ class KarianaSocketServer:
                     "available_commands": list(self.handlers.keys())
                 }
 
-        except json.JSONDecodeError as e:
-            return {"success": False, "error": f"Invalid JSON: {e}"}
         except Exception as e:
             return {"success": False, "error": str(e), "traceback": traceback.format_exc()}
 
@@ -383,8 +475,14 @@ class KarianaSocketServer:
         "capture_screenshot": 60.0,
         "execute_python": 30.0,
         "compile_blueprint": 30.0,
+        "batch_blueprint_edit": 60.0,
+        "add_blueprint_components_bulk": 60.0,
+        "apply_materials_to_actors": 60.0,
+        "create_material_instances": 60.0,
+        "flush_material_saves": 60.0,
         "execute_skill": 60.0,
         "import_asset": 60.0,
+        "import_assets": 120.0,
         "build_lighting": 120.0,
     }
 
@@ -600,7 +698,8 @@ class KarianaSocketServer:
             "parameters": {
                 "name": {"type": "string", "description": "Name of the Blueprint", "required": True},
                 "path": {"type": "string", "description": "Content path (e.g., /Game/Blueprints)", "default": "/Game/Blueprints"},
-                "parent_class": {"type": "string", "description": "Parent class (Actor, Pawn, Character)", "default": "Actor"}
+                "parent_class": {"type": "string", "description": "Parent class (Actor, Pawn, Character)", "default": "Actor"},
+                "open_editor": {"type": "boolean", "description": "Open the new Blueprint in the editor", "default": False}
             }
         })
         functions.append({
@@ -620,6 +719,13 @@ class KarianaSocketServer:
                 "blueprint_path": {"type": "string", "description": "Path to Blueprint (e.g., /Game/Blueprints/MyBP)", "required": True}
             }
         })
+        functions.append({
+            "name": "get_blueprint_info_many",
+            "description": "Get information about several Blueprints in one call",
+            "parameters": {
+                "blueprint_paths": {"type": "array", "description": "List of Blueprint paths", "required": True}
+            }
+        })
         functions.append({
             "name": "compile_blueprint",
             "description": "Compile a Blueprint",
@@ -627,6 +733,23 @@ class KarianaSocketServer:
                 "blueprint_path": {"type": "string", "description": "Path to Blueprint (e.g., /Game/Blueprints/MyBP)", "required": True}
             }
         })
+        functions.append({
+            "name": "batch_blueprint_edit",
+            "description": "Apply several component edits to a Blueprint with a single compile and save",
+            "parameters": {
+                "blueprint_path": {"type": "string", "description": "Path to Blueprint (e.g., /Game/Blueprints/MyBP)", "required": True},
+                "ops": {"type": "array", "description": "List of edits: {type: add_component|set_property|set_transform, ...same params as the single-edit tools}", "required": True},
+                "open_editor": {"type": "boolean", "description": "Open the Blueprint in the editor once the batch is saved", "default": False}
+            }
+        })
+        functions.append({
+            "name": "add_blueprint_components_bulk",
+            "description": "Add several components to a Blueprint with a single compile and save",
+            "parameters": {
+                "blueprint_path": {"type": "string", "description": "Path to Blueprint (e.g., /Game/Blueprints/MyBP)", "required": True},
+                "components": {"type": "array", "description": "List of {type, name, parent, transform: {location, rotation, scale}}", "required": True}
+            }
+        })
         functions.append({
             "name": "open_blueprint_editor",
             "description": "Open a Blueprint in the editor",
@@ -645,13 +768,21 @@ class KarianaSocketServer:
                 "asset_name": {"type": "string", "description": "Name for the imported asset"}
             }
         })
+        functions.append({
+            "name": "import_assets",
+            "description": "Import several external files in a single batch",
+            "parameters": {
+                "imports": {"type": "array", "description": "List of {source_path, destination_path, asset_name} entries", "required": True}
+            }
+        })
         functions.append({
             "name": "list_assets",
             "description": "List assets in a content folder",
             "parameters": {
                 "path": {"type": "string", "description": "Content path to list (e.g., /Game/Blueprints)", "default": "/Game"},
                 "asset_type": {"type": "string", "description": "Filter by asset type (Blueprint, Material, Texture, etc.)"},
-                "recursive": {"type": "boolean", "description": "Search recursively", "default": False}
+                "recursive": {"type": "boolean", "description": "Search recursively", "default": False},
+                "exact_match": {"type": "boolean", "description": "Match the class name exactly (filtered by the asset registry)", "default": False}
             }
         })
         functions.append({
@@ -679,6 +810,42 @@ class KarianaSocketServer:
                 "asset_path": {"type": "string", "description": "Path to asset (e.g., /Game/Blueprints/MyBP)", "required": True}
             }
         })
+        functions.append({
+            "name": "delete_asset",
+            "description": "Delete an asset",
+            "parameters": {
+                "asset_path": {"type": "string", "description": "Path to asset (e.g., /Game/Blueprints/MyBP)", "required": True}
+            }
+        })
+        functions.append({
+            "name": "delete_assets",
+            "description": "Delete several assets in a single batch",
+            "parameters": {
+                "asset_paths": {"type": "array", "description": "List of asset paths", "required": True}
+            }
+        })
+        functions.append({
+            "name": "duplicate_asset",
+            "description": "Duplicate an asset to a new path",
+            "parameters": {
+                "source_path": {"type": "string", "description": "Path of the asset to copy", "required": True},
+                "destination_path": {"type": "string", "description": "Path for the copy (e.g., /Game/Blueprints/MyBP_Copy)", "required": True}
+            }
+        })
+        functions.append({
+            "name": "duplicate_assets",
+            "description": "Duplicate several assets in one call",
+            "parameters": {
+                "duplicates": {"type": "array", "description": "List of {source_path, destination_path} entries", "required": True}
+            }
+        })
+
+        # Material functions
+        functions.append({
+            "name": "flush_material_saves",
+            "description": "Save every material asset created with autosave=false in one pass",
+            "parameters": {}
+        })
 
         # Editor functions
         for cmd in ["play_in_editor", "stop_play_in_editor", "set_camera_location"]: